@@ -3,16 +3,20 @@ Configuration management for Nebula Translate backend.
 Loads environment variables and provides typed configuration access.
 """
 
+import re
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import BeforeValidator
-from typing import Optional, List, Annotated
+from typing import Optional, Tuple, Annotated
 from enum import Enum
 
 
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
+
 def parse_comma_separated(v):
     """Parse comma-separated string into list."""
     if isinstance(v, str):
-        return [item.strip() for item in v.split(',') if item.strip()]
+        return [item for item in _CSV_SPLIT.split(v.strip()) if item]
     return v
 
 
@@ -40,10 +44,12 @@ class Settings(BaseSettings):
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
-    allowed_origins: Annotated[List[str], BeforeValidator(parse_comma_separated)] = [
+    # Sessions live in process memory, so more than one worker needs sticky routing by session
+    uvicorn_workers: int = 1
+    allowed_origins: Annotated[Tuple[str, ...], BeforeValidator(parse_comma_separated)] = (
         "http://localhost:3000",
         "http://localhost:3001"
-    ]
+    )
 
     # Transport Configuration
     transport_mode: TransportMode = TransportMode.WEBSOCKET
@@ -58,16 +64,19 @@ class Settings(BaseSettings):
     openrouter_api_key: str
     openrouter_base_url: str = "https://openrouter.ai/api/v1"
     openrouter_model: str = "anthropic/claude-3.5-sonnet"  # Default translation model
-    openrouter_fallback_models: List[str] = [
+    openrouter_fallback_models: Tuple[str, ...] = (
         "openai/gpt-4-turbo-preview",
         "anthropic/claude-3-opus"
-    ]
+    )
+    translation_cache_size: int = 512  # Per-session cache of repeated phrases (0 disables)
 
     # WebRTC Configuration
     stun_server_url: str = "stun:stun.l.google.com:19302"
     turn_server_url: Optional[str] = None
     turn_username: Optional[str] = None
     turn_credential: Optional[str] = None
+    max_concurrent_offers: int = 8  # WebRTC offers negotiated at once
+    offer_queue_timeout_seconds: float = 2.0  # Wait for a free slot before answering 503
 
     # VAD (Voice Activity Detection) Configuration
     vad_confidence_threshold: float = 0.7
@@ -101,9 +110,14 @@ class Settings(BaseSettings):
 # Global settings instance
 settings = Settings()
 
+# Values read on per-frame / per-request paths
+DEFAULT_TTS_VOICE = settings.openai_tts_voice
+AUDIO_SAMPLE_RATE = settings.audio_sample_rate
+AUDIO_CHANNELS = settings.audio_channels
+
 
 def get_webrtc_config() -> dict:
-    """Get WebRTC ICE server configuration."""
+    """Get WebRTC ICE server configuration (a new dict on every call)."""
     ice_servers = [
         {"urls": [settings.stun_server_url]}
     ]
@@ -123,20 +137,22 @@ def get_webrtc_config() -> dict:
     }
 
 
+# TTS voice per language prefix
+_TTS_VOICE_MAP = {
+    "en": "alloy",
+    "es": "nova",
+    "fr": "shimmer",
+    "de": "echo",
+    "it": "fable",
+    "pt": "onyx",
+    "ja": "nova",
+    "ko": "shimmer",
+    "zh": "alloy",
+}
+
+
 def get_tts_voice_for_language(language_code: str) -> str:
     """Map language codes to appropriate TTS voices."""
-    voice_map = {
-        "en": "alloy",
-        "es": "nova",
-        "fr": "shimmer",
-        "de": "echo",
-        "it": "fable",
-        "pt": "onyx",
-        "ja": "nova",
-        "ko": "shimmer",
-        "zh": "alloy",
-    }
-
     # Extract language prefix (e.g., "en-US" -> "en")
-    lang_prefix = language_code.split("-")[0].lower()
-    return voice_map.get(lang_prefix, settings.openai_tts_voice)
+    lang_prefix = language_code.partition("-")[0].lower()
+    return _TTS_VOICE_MAP.get(lang_prefix, DEFAULT_TTS_VOICE)
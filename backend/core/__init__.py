@@ -4,11 +4,12 @@ Core components for Nebula Translate backend.
 
 from .state_machine import TranslatorStateMachine
 from .session_manager import SessionManager, get_session_manager
-from .pipeline_manager import PipelineManager
+from .pipeline_manager import PipelineManager, PipelineBundle
 
 __all__ = [
     "TranslatorStateMachine",
     "SessionManager",
     "get_session_manager",
     "PipelineManager",
+    "PipelineBundle",
 ]
@@ -7,14 +7,20 @@ Orchestrates the frame-based audio processing pipeline:
 """
 
 import asyncio
-from typing import Optional, Callable, Any
-from datetime import datetime
+import functools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional, Callable, Any, Dict
+
+import numpy as np
 
 # Pipecat imports
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineTask
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.transports.base_transport import BaseTransport
 from pipecat.frames.frames import (
     Frame,
     AudioRawFrame,
@@ -28,10 +34,54 @@ from pipecat.frames.frames import (
     VADUserStoppedSpeakingFrame
 )
 
+from config import AUDIO_SAMPLE_RATE, AUDIO_CHANNELS
 from models import SessionData, SpeakerTurn, PTTState
 from utils import SessionLogger, calculate_audio_level
 from .state_machine import TranslatorStateMachine
 
+# Frame type groups used for per-frame dispatch (built once, not per frame).
+# isinstance is kept because transports emit VAD* subclasses of the speaking frames.
+_SPEECH_STARTED_FRAMES = (UserStartedSpeakingFrame, VADUserStartedSpeakingFrame)
+_SPEECH_STOPPED_FRAMES = (UserStoppedSpeakingFrame, VADUserStoppedSpeakingFrame)
+
+# Integer frame kinds for dispatch; resolved once per concrete frame type
+_KIND_OTHER = 0
+_KIND_AUDIO = 1
+_KIND_SPEECH_STARTED = 2
+_KIND_SPEECH_STOPPED = 3
+
+_FRAME_KINDS: Dict[type, int] = {}
+
+
+def _frame_kind(frame_type: type) -> int:
+    """
+    Get the dispatch kind of a frame type, memoizing the subclass checks.
+
+    Args:
+        frame_type: Concrete type of the frame
+
+    Returns:
+        One of the _KIND_* constants
+    """
+    kind = _FRAME_KINDS.get(frame_type)
+    if kind is None:
+        if issubclass(frame_type, _SPEECH_STARTED_FRAMES):
+            kind = _KIND_SPEECH_STARTED
+        elif issubclass(frame_type, _SPEECH_STOPPED_FRAMES):
+            kind = _KIND_SPEECH_STOPPED
+        elif issubclass(frame_type, AudioRawFrame):
+            kind = _KIND_AUDIO
+        else:
+            kind = _KIND_OTHER
+        _FRAME_KINDS[frame_type] = kind
+    return kind
+
+# Normalizes PCM16 sample values to [-1.0, 1.0]
+_PCM16_SCALE = 1.0 / 32768.0
+
+# Typical duration of one input audio frame
+_INPUT_FRAME_MS = 20
+
 
 class PipelineManager:
     """
@@ -42,6 +92,30 @@ class PipelineManager:
     - PTT Released: Partner pipeline (text only, VAD enabled)
     """
 
+    __slots__ = (
+        "session",
+        "state_machine",
+        "logger",
+        "pipeline",
+        "task",
+        "runner",
+        "stt_processor",
+        "tts_processor",
+        "translation_processor",
+        "vad_processor",
+        "on_audio_output",
+        "on_text_output",
+        "on_audio_level",
+        "on_thinking",
+        "_processing_start_time",
+        "_stt_start_time",
+        "_translation_start_time",
+        "_tts_start_time",
+        "_make_audio_frame",
+        "_loop",
+        "_callback_tasks",
+    )
+
     def __init__(
         self,
         session: SessionData,
@@ -68,11 +142,22 @@ class PipelineManager:
         self.on_audio_level: Optional[Callable[[float, SpeakerTurn], None]] = None
         self.on_thinking: Optional[Callable[[bool], None]] = None
 
-        # Processing tracking
-        self._processing_start_time: Optional[datetime] = None
-        self._stt_start_time: Optional[datetime] = None
-        self._translation_start_time: Optional[datetime] = None
-        self._tts_start_time: Optional[datetime] = None
+        # Processing tracking (time.monotonic_ns() timestamps)
+        self._processing_start_time: Optional[int] = None
+        self._stt_start_time: Optional[int] = None
+        self._translation_start_time: Optional[int] = None
+        self._tts_start_time: Optional[int] = None
+
+        # Input audio format is fixed per process, so bind it once
+        self._make_audio_frame = functools.partial(
+            AudioRawFrame,
+            sample_rate=AUDIO_SAMPLE_RATE,
+            num_channels=AUDIO_CHANNELS
+        )
+
+        # Frontend callbacks run on a later loop tick instead of inside process_frame
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._callback_tasks: set = set()
 
     def set_services(
         self,
@@ -93,12 +178,12 @@ class PipelineManager:
 
     async def initialize(self):
         """Initialize the Pipecat pipeline."""
-        if not all([
-            self.stt_processor,
-            self.tts_processor,
-            self.translation_processor,
-            self.vad_processor  # VAD is now required
-        ]):
+        if (
+            self.stt_processor is None
+            or self.tts_processor is None
+            or self.translation_processor is None
+            or self.vad_processor is None  # VAD is now required
+        ):
             raise RuntimeError("Services must be set before initializing pipeline")
 
         # Create custom processors for routing and callbacks
@@ -151,14 +236,7 @@ class PipelineManager:
         if not self.pipeline or not self.task:
             return
 
-        # Create audio frame
-        audio_frame = AudioRawFrame(
-            audio=audio_data,
-            sample_rate=16000,
-            num_channels=1
-        )
-
-        # Push frame into pipeline
+        audio_frame = self._make_audio_frame(audio=audio_data)
         await self.task.queue_frame(audio_frame, FrameDirection.DOWNSTREAM)
 
     async def handle_ptt_press(self):
@@ -167,7 +245,7 @@ class PipelineManager:
         self.logger.debug("PTT pressed - User turn started")
 
         # Reset processing timers
-        self._processing_start_time = datetime.utcnow()
+        self._processing_start_time = time.monotonic_ns()
 
     async def handle_ptt_release(self):
         """Handle PTT button release event."""
@@ -176,7 +254,7 @@ class PipelineManager:
 
     def start_processing(self, stage: str):
         """Mark the start of a processing stage."""
-        now = datetime.utcnow()
+        now = time.monotonic_ns()
 
         if stage == "stt":
             self._stt_start_time = now
@@ -187,7 +265,7 @@ class PipelineManager:
 
         # Notify frontend that processing started
         if self.on_thinking:
-            self.on_thinking(True)
+            self._dispatch(self.on_thinking, True)
 
     def finish_processing(self, stage: str) -> float:
         """
@@ -199,37 +277,113 @@ class PipelineManager:
         Returns:
             Latency in milliseconds
         """
-        now = datetime.utcnow()
+        now = time.monotonic_ns()
         latency_ms = 0.0
 
-        if stage == "stt" and self._stt_start_time:
-            latency_ms = (now - self._stt_start_time).total_seconds() * 1000
+        if stage == "stt" and self._stt_start_time is not None:
+            latency_ms = (now - self._stt_start_time) / 1_000_000
             self._stt_start_time = None
 
-        elif stage == "translation" and self._translation_start_time:
-            latency_ms = (now - self._translation_start_time).total_seconds() * 1000
+        elif stage == "translation" and self._translation_start_time is not None:
+            latency_ms = (now - self._translation_start_time) / 1_000_000
             self._translation_start_time = None
 
-        elif stage == "tts" and self._tts_start_time:
-            latency_ms = (now - self._tts_start_time).total_seconds() * 1000
+        elif stage == "tts" and self._tts_start_time is not None:
+            latency_ms = (now - self._tts_start_time) / 1_000_000
             self._tts_start_time = None
 
         return latency_ms
 
+    def _dispatch(self, callback: Callable, *args: Any):
+        """
+        Schedule a frontend callback without running it inside the pipeline.
+
+        Coroutine callbacks become tasks; plain callbacks run on the next loop tick.
+        Callbacks do not guard themselves: their errors are logged here instead.
+
+        Args:
+            callback: Callback to invoke
+            *args: Arguments passed to the callback
+        """
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+
+        if asyncio.iscoroutinefunction(callback):
+            task = loop.create_task(callback(*args))
+            self._callback_tasks.add(task)
+            task.add_done_callback(
+                functools.partial(self._on_callback_task_done, callback)
+            )
+        else:
+            loop.call_soon(self._run_callback, callback, args)
+
+    def _run_callback(self, callback: Callable, args: tuple):
+        """Run a plain frontend callback, logging instead of raising on failure."""
+        try:
+            callback(*args)
+        except Exception:
+            self._log_callback_failure(callback)
+
+    def _on_callback_task_done(self, callback: Callable, task: asyncio.Task):
+        """Release a finished coroutine callback task, logging its failure if any."""
+        self._callback_tasks.discard(task)
+        if task.cancelled():
+            return
+
+        try:
+            task.result()
+        except Exception:
+            self._log_callback_failure(callback)
+
+    def _log_callback_failure(self, callback: Callable):
+        """Log the frontend callback failure currently being handled."""
+        self.logger.exception(
+            "Frontend callback {} failed",
+            getattr(callback, "__qualname__", repr(callback))
+        )
+
     def _emit_audio_output(self, audio_data: bytes):
         """Emit audio output to frontend."""
         if self.on_audio_output:
-            self.on_audio_output(audio_data)
+            self._dispatch(self.on_audio_output, audio_data)
 
     def _emit_text_output(self, text: str, speaker: SpeakerTurn):
         """Emit text output to frontend."""
         if self.on_text_output:
-            self.on_text_output(text, speaker)
+            self._dispatch(self.on_text_output, text, speaker)
 
     def _emit_audio_level(self, level: float, speaker: SpeakerTurn):
         """Emit audio level for visualization."""
         if self.on_audio_level:
-            self.on_audio_level(level, speaker)
+            self._dispatch(self.on_audio_level, level, speaker)
+
+
+@dataclass(slots=True)
+class PipelineBundle:
+    """Running pipeline components for one session, kept for cleanup."""
+    pipeline: Pipeline
+    task: PipelineTask
+    runner: PipelineRunner
+    transport: BaseTransport
+    background_task: asyncio.Task
+    pipeline_manager: PipelineManager
+
+    async def close(self, timeout: float = 5.0):
+        """
+        Cancel the pipeline and wait for its runner task to exit.
+
+        Args:
+            timeout: Seconds to wait for the runner before cancelling its task outright
+        """
+        if self.background_task.done():
+            return
+
+        await self.task.cancel()
+
+        done, _ = await asyncio.wait({self.background_task}, timeout=timeout)
+        if not done:
+            self.background_task.cancel()
 
 
 class AudioRouterProcessor(FrameProcessor):
@@ -241,16 +395,32 @@ class AudioRouterProcessor(FrameProcessor):
     - PTT Released + No VAD: Drop frames
     """
 
+    __slots__ = (
+        "manager", "_frame_count", "_last_log_time", "_log_mask", "_warned_drop", "_handlers"
+    )
+
     def __init__(self, manager: PipelineManager):
         super().__init__()
         self.manager = manager
         self._frame_count = 0
         self._last_log_time = None
+        # Trace every 128th audio frame (power of two so the check is a mask)
+        self._log_mask = 127
+        # Drop warning fires once per stretch of dropped frames
+        self._warned_drop = False
+        # Handlers indexed by frame kind; None marks frames passed through untouched
+        self._handlers = (
+            None,                       # _KIND_OTHER
+            self._on_audio,             # _KIND_AUDIO
+            self._on_speech_started,    # _KIND_SPEECH_STARTED
+            self._on_speech_stopped,    # _KIND_SPEECH_STOPPED
+        )
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
+        handler = self._handlers[_frame_kind(type(frame))]
+
         # Handle system frames (StartFrame, EndFrame, etc.) with parent class
-        if not isinstance(frame, (AudioRawFrame, UserStartedSpeakingFrame, UserStoppedSpeakingFrame,
-                                   VADUserStartedSpeakingFrame, VADUserStoppedSpeakingFrame)):
+        if handler is None:
             await super().process_frame(frame, direction)
             await self.push_frame(frame, direction)  # CRITICAL: Forward SystemFrames too!
             return
@@ -260,79 +430,92 @@ class AudioRouterProcessor(FrameProcessor):
             await self.push_frame(frame, direction)
             return
 
+        await handler(frame, direction)
+
+    async def _on_speech_started(self, frame: Frame, direction: FrameDirection):
         # Handle Speaking Frames (VAD or PTT) - transport generates VAD* versions
-        if isinstance(frame, (UserStartedSpeakingFrame, VADUserStartedSpeakingFrame)):
-            # Always pass StartSpeaking (PTT or VAD)
+        # Always pass StartSpeaking (PTT or VAD)
+        log_info = self.manager.logger.is_enabled_for(logging.INFO)
+        if log_info:
             state_info = self.manager.state_machine.get_state_info()
             self.manager.logger.info(
-                f"[AUDIO_ROUTER] 🎤 UserStartedSpeakingFrame received - "
-                f"State: {state_info['state']}, PTT: {state_info['ptt_pressed']}"
+                "[AUDIO_ROUTER] 🎤 UserStartedSpeakingFrame received - State: {}, PTT: {}",
+                state_info['state'], state_info['ptt_pressed']
             )
 
-            # If PTT is NOT pressed, this is partner speaking via VAD
-            if not self.manager.state_machine.is_user_turn:
-                self.manager.state_machine.start_partner_processing()
+        # If PTT is NOT pressed, this is partner speaking via VAD
+        if not self.manager.state_machine.is_user_turn:
+            self.manager.state_machine.start_partner_processing()
+            if log_info:
                 self.manager.logger.info("[AUDIO_ROUTER] ✅ Started partner processing (VAD detected)")
 
-            await self.push_frame(frame, direction)
-            return
+        await self.push_frame(frame, direction)
 
-        if isinstance(frame, (UserStoppedSpeakingFrame, VADUserStoppedSpeakingFrame)):
-            # If PTT is pressed, IGNORE StopSpeaking (prevent VAD from cutting off user)
-            if self.manager.state_machine.is_user_turn:
+    async def _on_speech_stopped(self, frame: Frame, direction: FrameDirection):
+        log_info = self.manager.logger.is_enabled_for(logging.INFO)
+        # If PTT is pressed, IGNORE StopSpeaking (prevent VAD from cutting off user)
+        if self.manager.state_machine.is_user_turn:
+            if log_info:
                 self.manager.logger.info(
                     "[AUDIO_ROUTER] 🔇 Ignoring UserStoppedSpeakingFrame (PTT pressed, user still speaking)"
                 )
-                return
-            # Otherwise pass it (partner stopped speaking)
+            return
+        # Otherwise pass it (partner stopped speaking)
+        if log_info:
             state_info = self.manager.state_machine.get_state_info()
             self.manager.logger.info(
-                f"[AUDIO_ROUTER] 🔇 UserStoppedSpeakingFrame received - "
-                f"State: {state_info['state']}, PTT: {state_info['ptt_pressed']}"
+                "[AUDIO_ROUTER] 🔇 UserStoppedSpeakingFrame received - State: {}, PTT: {}",
+                state_info['state'], state_info['ptt_pressed']
             )
-            await self.push_frame(frame, direction)
+        await self.push_frame(frame, direction)
 
-            # Finish partner processing (partner stopped speaking)
-            self.manager.state_machine.finish_partner_processing()
+        # Finish partner processing (partner stopped speaking)
+        self.manager.state_machine.finish_partner_processing()
+        if log_info:
             self.manager.logger.info("[AUDIO_ROUTER] ✅ Finished partner processing")
-            return
 
-        # Handle Audio Frames
-        if isinstance(frame, AudioRawFrame):
-            # Log audio frame receipt (throttled)
-            self._frame_count += 1
+    async def _on_audio(self, frame: AudioRawFrame, direction: FrameDirection):
+        self._frame_count += 1
 
-            # Log every 50th frame with routing decision (more frequent for debugging)
-            if self._frame_count % 50 == 1:
-                state_info = self.manager.state_machine.get_state_info()
-                self.manager.logger.info(
-                    f"[AUDIO_ROUTER] Frame #{self._frame_count} - State: {state_info['state']}, "
-                    f"PTT: {state_info['ptt_pressed']}, VAD_should_enable: {state_info['should_enable_vad']}"
+        # Throttled routing trace, built only when DEBUG output is enabled
+        log_frame = (
+            (self._frame_count & self._log_mask) == 1
+            and self.manager.logger.is_enabled_for(logging.DEBUG)
+        )
+        if log_frame:
+            state_info = self.manager.state_machine.get_state_info()
+            self.manager.logger.debug(
+                "[AUDIO_ROUTER] Frame #{} - State: {}, PTT: {}, VAD_should_enable: {}",
+                self._frame_count, state_info['state'], state_info['ptt_pressed'],
+                state_info['should_enable_vad']
+            )
+
+        # Route audio based on state
+        if self.manager.state_machine.is_user_turn:
+            # User turn: Forward audio (PTT pressed)
+            if log_frame:
+                self.manager.logger.debug("[AUDIO_ROUTER] ✅ Forwarding frame #{} (USER TURN)", self._frame_count)
+            self._warned_drop = False
+            await self.push_frame(frame, direction)
+
+        elif self.manager.state_machine.is_partner_turn:
+            # Partner turn (includes listening AND processing): Forward audio
+            if log_frame:
+                self.manager.logger.debug(
+                    "[AUDIO_ROUTER] ✅ Forwarding frame #{} (PARTNER - {})",
+                    self._frame_count, self.manager.state_machine.state.value
                 )
+            self._warned_drop = False
+            await self.push_frame(frame, direction)
 
-            # Route audio based on state
-            if self.manager.state_machine.is_user_turn:
-                # User turn: Forward audio (PTT pressed)
-                if self._frame_count % 50 == 1:
-                    self.manager.logger.info(f"[AUDIO_ROUTER] ✅ Forwarding frame #{self._frame_count} (USER TURN)")
-                await self.push_frame(frame, direction)
-
-            elif self.manager.state_machine.is_partner_turn:
-                # Partner turn (includes listening AND processing): Forward audio
-                if self._frame_count % 50 == 1:
-                    state = self.manager.state_machine.state.value
-                    self.manager.logger.info(f"[AUDIO_ROUTER] ✅ Forwarding frame #{self._frame_count} (PARTNER - {state})")
-                await self.push_frame(frame, direction)
-
-            else:
-                # Drop frame (idle/disconnected state)
-                if self._frame_count % 50 == 1:
-                    state_info = self.manager.state_machine.get_state_info()
-                    self.manager.logger.warning(
-                        f"[AUDIO_ROUTER] ❌ DROPPING frame #{self._frame_count} - State: {state_info['state']}, "
-                        f"PTT: {state_info['ptt_pressed']}"
-                    )
-                pass
+        elif not self._warned_drop:
+            # Drop frame (idle/disconnected state)
+            state_info = self.manager.state_machine.get_state_info()
+            self.manager.logger.warning(
+                "[AUDIO_ROUTER] ❌ DROPPING frames from #{} - State: {}, PTT: {}",
+                self._frame_count, state_info['state'], state_info['ptt_pressed']
+            )
+            self._warned_drop = True
 
 
 class TextRouterProcessor(FrameProcessor):
@@ -343,6 +526,8 @@ class TextRouterProcessor(FrameProcessor):
     - Partner turn: Send to frontend (text only)
     """
 
+    __slots__ = ("manager",)
+
     def __init__(self, manager: PipelineManager):
         super().__init__()
         self.manager = manager
@@ -354,26 +539,23 @@ class TextRouterProcessor(FrameProcessor):
             await self.push_frame(frame, direction)  # CRITICAL: Forward SystemFrames too!
             return
 
-        # Determine speaker from state (no need to check current_speaker!)
-        speaker = "user" if self.manager.state_machine.should_output_audio else "partner"
+        # Determine speaker from state once (no need to check current_speaker!)
+        output_audio = self.manager.state_machine.should_output_audio
+        speaker = "user" if output_audio else "partner"
 
         # Debug logging to track text frame routing
-        self.manager.logger.info(f"[TEXT_ROUTER] Received TextFrame: '{frame.text}'")
-        self.manager.logger.info(f"[TEXT_ROUTER] speaker: {speaker}")
-        self.manager.logger.info(f"[TEXT_ROUTER] should_output_audio: {self.manager.state_machine.should_output_audio}")
+        if self.manager.logger.is_enabled_for(logging.INFO):
+            self.manager.logger.info(
+                "[TEXT_ROUTER] Received TextFrame: '{}' - speaker: {}, should_output_audio: {}",
+                frame.text, speaker, output_audio
+            )
 
-        if self.manager.state_machine.should_output_audio:
-            # User turn: forward to TTS
+        # User turn: forward to TTS. Partner turn: text only, no TTS
+        if output_audio:
             await self.push_frame(frame, direction)
-            # Also emit text for display
-            self.manager.logger.info(f"[TEXT_ROUTER] Calling _emit_text_output (USER TURN)")
-            self.manager._emit_text_output(frame.text, speaker)
 
-        else:
-            # Partner turn: text only, no TTS
-            self.manager.logger.info(f"[TEXT_ROUTER] Calling _emit_text_output (PARTNER TURN)")
-            self.manager._emit_text_output(frame.text, speaker)
-            # Don't forward to TTS
+        # Emit text for display in both turns
+        self.manager._emit_text_output(frame.text, speaker)
 
 
 class VADLogger(FrameProcessor):
@@ -381,6 +563,8 @@ class VADLogger(FrameProcessor):
     Logs VAD (Voice Activity Detection) events for debugging.
     """
 
+    __slots__ = ("manager", "_frame_count")
+
     def __init__(self, manager: PipelineManager):
         super().__init__()
         self.manager = manager
@@ -394,9 +578,10 @@ class VADLogger(FrameProcessor):
         self._frame_count += 1
 
         # Log VAD events (transport generates VAD* frame types)
-        if isinstance(frame, (VADUserStartedSpeakingFrame, UserStartedSpeakingFrame)):
+        kind = _frame_kind(type(frame))
+        if kind == _KIND_SPEECH_STARTED:
             self.manager.logger.info("[VAD] 🎤 Speech STARTED - VAD detected voice activity")
-        elif isinstance(frame, (VADUserStoppedSpeakingFrame, UserStoppedSpeakingFrame)):
+        elif kind == _KIND_SPEECH_STOPPED:
             self.manager.logger.info("[VAD] 🔇 Speech STOPPED - VAD detected silence")
 
         # Log every 100th frame for debugging
@@ -412,20 +597,63 @@ class VADLogger(FrameProcessor):
         await self.push_frame(frame, direction)
 
 
+class PipelineReadyMarker(FrameProcessor):
+    """
+    Signals when the StartFrame has reached the end of the pipeline.
+
+    Placed just before the transport output, so every processor upstream has
+    been started once the event is set.
+    """
+
+    __slots__ = ("_ready",)
+
+    def __init__(self, ready: asyncio.Event):
+        super().__init__()
+        self._ready = ready
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, StartFrame):
+            self._ready.set()
+
+        await self.push_frame(frame, direction)
+
+
 class AudioLevelMonitor(FrameProcessor):
     """
     Monitors audio input levels for visualization.
+
+    Levels are averaged over EMIT_EVERY frames so the meter updates at ~15 Hz
+    instead of once per 20 ms chunk. An average never spans two speakers.
     """
 
+    EMIT_EVERY = 3
+
+    __slots__ = (
+        "manager",
+        "_frame_count",
+        "_scratch",
+        "_level_accum",
+        "_level_n",
+        "_level_speaker",
+    )
+
     def __init__(self, manager: PipelineManager):
         super().__init__()
         self.manager = manager
         self._frame_count = 0
+        # Reused float32 buffer for level calculation (avoids per-frame allocation).
+        # Sized for a typical 20 ms chunk; grows only if a larger frame arrives.
+        self._scratch = np.empty(
+            AUDIO_SAMPLE_RATE * AUDIO_CHANNELS * _INPUT_FRAME_MS // 1000,
+            dtype=np.float32
+        )
+        self._level_accum = 0.0
+        self._level_n = 0
+        self._level_speaker = SpeakerTurn.NONE
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
-        # FIRST: Let parent class handle system frames (StartFrame, CancelFrame, etc.)
-        await super().process_frame(frame, direction)
-
         # Track all frames for debugging
         self._frame_count += 1
 
@@ -441,25 +669,47 @@ class AudioLevelMonitor(FrameProcessor):
                 f"started={started}, next={next_processor}"
             )
 
-        # Monitor AudioRawFrame before forwarding
+        # Monitor AudioRawFrame before forwarding. Audio frames skip the parent
+        # handler, which only manages system frames (same as AudioRouterProcessor).
         if isinstance(frame, AudioRawFrame) and direction == FrameDirection.DOWNSTREAM:
             # Log audio frame details
             if self._frame_count % 100 == 1:
                 self.manager.logger.info(f"[AUDIO_MONITOR] Audio frame size={len(frame.audio)} bytes")
 
-            # Calculate audio level
-            try:
-                import numpy as np
-                audio_array = np.frombuffer(frame.audio, dtype=np.int16).astype(np.float32) / 32768.0
-                level = calculate_audio_level(audio_array)
-
-                # Determine speaker
-                speaker = self.manager.state_machine.current_speaker
-                if speaker:
-                    self.manager._emit_audio_level(level, speaker)
+            # Calculate audio level only when someone will receive it
+            speaker = self.manager.state_machine.current_speaker
+            if self.manager.on_audio_level is None:
+                speaker = SpeakerTurn.NONE
+
+            # Start a fresh average on every speaker change, including going idle
+            if speaker is not self._level_speaker:
+                self._level_accum = 0.0
+                self._level_n = 0
+                self._level_speaker = speaker
+
+            if speaker is not SpeakerTurn.NONE:
+                try:
+                    raw = np.frombuffer(frame.audio, dtype=np.int16)
+                    if raw.size > self._scratch.size:
+                        self._scratch = np.empty(raw.size, dtype=np.float32)
+                    samples = self._scratch[:raw.size]
+
+                    # Widen into the reused buffer; PCM16 normalization is applied to the RMS scalar
+                    np.copyto(samples, raw)
+                    self._level_accum += calculate_audio_level(samples, scale=_PCM16_SCALE)
+                    self._level_n += 1
+
+                    if self._level_n >= self.EMIT_EVERY:
+                        self.manager._emit_audio_level(self._level_accum / self._level_n, speaker)
+                        self._level_accum = 0.0
+                        self._level_n = 0
+
+                except Exception as e:
+                    self.manager.logger.error(f"Error calculating audio level: {e}")
 
-            except Exception as e:
-                self.manager.logger.error(f"Error calculating audio level: {e}")
+        else:
+            # Let parent class handle system frames (StartFrame, CancelFrame, etc.)
+            await super().process_frame(frame, direction)
 
         # CRITICAL: Forward ALL frames to next processor in pipeline
         try:
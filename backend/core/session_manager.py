@@ -3,9 +3,13 @@ Session manager for handling session lifecycle, state, and message history.
 """
 
 import uuid
+import time
+import heapq
 import asyncio
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+from itertools import islice
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from datetime import datetime
 from models import (
     SessionData,
     SessionState,
@@ -15,10 +19,28 @@ from models import (
     LanguageCode,
     SessionMetrics
 )
-from utils import SessionLogger
+from utils import SessionLogger, get_logger
 from .state_machine import TranslatorStateMachine
 from config import settings
 
+if TYPE_CHECKING:
+    from .pipeline_manager import PipelineBundle
+
+logger = get_logger(__name__)
+
+# Weight of the newest sample in the latency moving averages
+_LATENCY_EMA_ALPHA = 0.1
+
+
+@dataclass(slots=True)
+class SessionBundle:
+    """Everything tracked for one session, stored under a single key."""
+    data: SessionData
+    state_machine: TranslatorStateMachine
+    metrics: SessionMetrics
+    logger: SessionLogger
+    snapshot: SessionSnapshot
+
 
 class SessionManager:
     """
@@ -33,11 +55,13 @@ class SessionManager:
     """
 
     def __init__(self):
-        self._sessions: Dict[str, SessionData] = {}
-        self._state_machines: Dict[str, TranslatorStateMachine] = {}
-        self._metrics: Dict[str, SessionMetrics] = {}
-        self._pipelines: Dict[str, dict] = {}  # Store pipeline components for cleanup
+        self._sessions: Dict[str, SessionBundle] = {}
+        self._pipelines: Dict[str, "PipelineBundle"] = {}  # Store pipeline components for cleanup
         self._cleanup_task: Optional[asyncio.Task] = None
+        # Min-heap of (last_activity_ns, session_id) with one entry per session, pushed
+        # on create. Activity does not touch it: the cleanup sweep re-queues sessions
+        # whose activity moved on, and entries of closed sessions are dropped lazily.
+        self._expiry_heap: List[Tuple[int, str]] = []
 
     async def start(self):
         """Start the session manager and background tasks."""
@@ -78,8 +102,8 @@ class SessionManager:
         if len(self._sessions) >= settings.max_sessions:
             raise RuntimeError("Maximum number of sessions reached")
 
-        # Generate unique session ID
-        session_id = str(uuid.uuid4())
+        # Generate unique session ID (opaque 32-char hex)
+        session_id = uuid.uuid4().hex
 
         # Create session data
         session = SessionData(
@@ -90,8 +114,21 @@ class SessionManager:
             user_id=user_id
         )
 
+        # Listing snapshot, kept current on every change so list_sessions() is a copy
+        snapshot = SessionSnapshot(
+            session_id=session_id,
+            state=session.state,
+            home_language=home_language,
+            target_language=target_language,
+            created_at=session.created_at,
+            last_activity=session.last_activity,
+            message_count=0
+        )
+
+        session_logger = SessionLogger(session_id)
+
         # Create state machine for this session
-        state_machine = TranslatorStateMachine(session_id)
+        state_machine = TranslatorStateMachine(session_id, logger=session_logger)
         state_machine.set_on_state_change(
             lambda old, new: self._on_state_change(session_id, old, new)
         )
@@ -101,51 +138,83 @@ class SessionManager:
         metrics = SessionMetrics(session_id=session_id)
 
         # Store session
-        self._sessions[session_id] = session
-        self._state_machines[session_id] = state_machine
-        self._metrics[session_id] = metrics
+        self._sessions[session_id] = SessionBundle(
+            data=session,
+            state_machine=state_machine,
+            metrics=metrics,
+            logger=session_logger,
+            snapshot=snapshot
+        )
+        self._push_expiry(session_id, session.last_activity_ns)
 
-        logger = SessionLogger(session_id)
-        logger.info(
-            f"Session created: {home_language.value} ↔ {target_language.value}"
+        session_logger.info(
+            "Session created: {} ↔ {}", home_language.value, target_language.value
         )
 
         return session
 
     def get_session(self, session_id: str) -> Optional[SessionData]:
         """Get session by ID."""
-        return self._sessions.get(session_id)
+        bundle = self._sessions.get(session_id)
+        return bundle.data if bundle else None
 
     def get_state_machine(self, session_id: str) -> Optional[TranslatorStateMachine]:
         """Get state machine for session."""
-        return self._state_machines.get(session_id)
+        bundle = self._sessions.get(session_id)
+        return bundle.state_machine if bundle else None
 
     def get_metrics(self, session_id: str) -> Optional[SessionMetrics]:
         """Get metrics for session."""
-        return self._metrics.get(session_id)
+        bundle = self._sessions.get(session_id)
+        return bundle.metrics if bundle else None
+
+    def register_pipeline(self, session_id: str, pipeline: "PipelineBundle"):
+        """
+        Track the running pipeline of a session so it is released with the session.
+
+        The entry is also dropped as soon as the pipeline's runner task exits.
+        """
+        self._pipelines[session_id] = pipeline
+        pipeline.background_task.add_done_callback(
+            lambda task: self._on_pipeline_done(session_id, pipeline, task)
+        )
+
+    def _on_pipeline_done(self, session_id: str, pipeline: "PipelineBundle", task: asyncio.Task):
+        """Release a pipeline whose runner task exited and report how it ended."""
+        # A newer pipeline may have replaced this one for the same session
+        if self._pipelines.get(session_id) is pipeline:
+            del self._pipelines[session_id]
+
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error is not None:
+            logger.error("Pipeline for session {} failed: {!r}", session_id, error)
 
     async def close_session(self, session_id: str):
         """Close and cleanup a session."""
-        if session_id not in self._sessions:
+        bundle = self._sessions.get(session_id)
+        if bundle is None:
             return
 
-        # Get state machine and disconnect
-        state_machine = self._state_machines.get(session_id)
-        if state_machine:
-            state_machine.disconnect()
+        # Disconnect while still tracked so the state change is recorded
+        bundle.state_machine.disconnect()
 
         # Remove from tracking
-        session = self._sessions.pop(session_id, None)
-        self._state_machines.pop(session_id, None)
-        metrics = self._metrics.pop(session_id, None)
-
-        logger = SessionLogger(session_id)
-        if session and metrics:
-            logger.info(
-                f"Session closed - Duration: {self._get_session_duration(session)}s, "
-                f"Messages: {len(session.messages)}, "
-                f"Avg latency: {metrics.avg_total_latency:.0f}ms"
-            )
+        self._sessions.pop(session_id, None)
+
+        # Stop the session's pipeline so its runner task never outlives the session
+        pipeline = self._pipelines.pop(session_id, None)
+        if pipeline is not None:
+            await pipeline.close()
+
+        session = bundle.data
+        bundle.logger.info(
+            f"Session closed - Duration: {self._get_session_duration(session)}s, "
+            f"Messages: {len(session.messages)}, "
+            f"Avg latency: {bundle.metrics.avg_total_latency:.0f}ms"
+        )
 
     def add_message(
         self,
@@ -170,9 +239,10 @@ class SessionManager:
         Returns:
             Message object if successful, None otherwise
         """
-        session = self._sessions.get(session_id)
-        if not session:
+        bundle = self._sessions.get(session_id)
+        if bundle is None:
             return None
+        session = bundle.data
 
         # Determine languages if not provided
         if speaker == SpeakerTurn.USER:
@@ -184,7 +254,7 @@ class SessionManager:
 
         # Create message
         message = Message(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,  # Opaque 32-char hex
             session_id=session_id,
             speaker=speaker,
             original_text=original_text,
@@ -193,10 +263,9 @@ class SessionManager:
             target_language=target_language
         )
 
-        # Add to session history (limited to last 50 messages)
+        # Add to session history (bounded deque drops the oldest message)
         session.messages.append(message)
-        if len(session.messages) > 50:
-            session.messages = session.messages[-50:]
+        bundle.snapshot.message_count = len(session.messages)
 
         # Update statistics
         if speaker == SpeakerTurn.USER:
@@ -205,7 +274,7 @@ class SessionManager:
             session.total_partner_turns += 1
 
         # Update activity timestamp
-        session.last_activity = datetime.utcnow()
+        self._touch(bundle)
 
         return message
 
@@ -219,46 +288,43 @@ class SessionManager:
         error_type: Optional[str] = None
     ):
         """Update session metrics with processing latencies."""
-        metrics = self._metrics.get(session_id)
-        session = self._sessions.get(session_id)
-
-        if not metrics or not session:
+        bundle = self._sessions.get(session_id)
+        if bundle is None:
             return
 
+        metrics = bundle.metrics
+        session = bundle.data
+
         metrics.total_turns += 1
 
         if success:
             metrics.successful_turns += 1
 
-            # Update latency averages (simple moving average)
+            # Update latency averages (exponential moving average, favors recent turns)
             if stt_latency is not None:
-                metrics.avg_stt_latency = self._update_average(
+                metrics.avg_stt_latency = self._ema(
                     metrics.avg_stt_latency,
-                    stt_latency,
-                    metrics.total_turns
+                    stt_latency
                 )
 
             if translation_latency is not None:
-                metrics.avg_translation_latency = self._update_average(
+                metrics.avg_translation_latency = self._ema(
                     metrics.avg_translation_latency,
-                    translation_latency,
-                    metrics.total_turns
+                    translation_latency
                 )
 
             if tts_latency is not None:
-                metrics.avg_tts_latency = self._update_average(
+                metrics.avg_tts_latency = self._ema(
                     metrics.avg_tts_latency,
-                    tts_latency,
-                    metrics.total_turns
+                    tts_latency
                 )
 
             # Calculate total latency
             total = (stt_latency or 0) + (translation_latency or 0) + (tts_latency or 0)
             if total > 0:
-                metrics.avg_total_latency = self._update_average(
+                metrics.avg_total_latency = self._ema(
                     metrics.avg_total_latency,
-                    total,
-                    metrics.total_turns
+                    total
                 )
 
                 # Update session total processing time
@@ -275,22 +341,26 @@ class SessionManager:
             elif error_type == "tts":
                 metrics.tts_errors += 1
 
-    def list_sessions(self) -> list[SessionSnapshot]:
-        """Get a list of all active sessions."""
-        snapshots = []
-        for session in self._sessions.values():
-            snapshot = SessionSnapshot(
-                session_id=session.session_id,
-                state=session.state,
-                home_language=session.home_language,
-                target_language=session.target_language,
-                created_at=session.created_at,
-                last_activity=session.last_activity,
-                message_count=len(session.messages)
-            )
-            snapshots.append(snapshot)
-
-        return snapshots
+    def active_count(self) -> int:
+        """Get the number of active sessions."""
+        return len(self._sessions)
+
+    def list_sessions(self, offset: int = 0, limit: Optional[int] = None) -> list[SessionSnapshot]:
+        """
+        Get a list of active sessions, in creation order.
+
+        Args:
+            offset: Number of sessions to skip
+            limit: Maximum number of sessions to return (all remaining if None)
+
+        Returns:
+            Session snapshots for the requested page
+        """
+        bundles = self._sessions.values()
+        if offset or limit is not None:
+            stop = None if limit is None else offset + limit
+            bundles = islice(bundles, offset, stop)
+        return [bundle.snapshot for bundle in bundles]
 
     async def _cleanup_inactive_sessions(self):
         """Background task to cleanup inactive sessions."""
@@ -298,25 +368,34 @@ class SessionManager:
             try:
                 await asyncio.sleep(60)  # Check every minute
 
-                now = datetime.utcnow()
-                timeout_threshold = timedelta(seconds=settings.session_timeout_seconds)
+                cutoff_ns = time.monotonic_ns() - settings.session_timeout_seconds * 1_000_000_000
 
-                # Find inactive sessions
+                # Find inactive sessions (only heap entries older than the cutoff are visited)
                 inactive_sessions = []
-                for session_id, session in self._sessions.items():
-                    if now - session.last_activity > timeout_threshold:
+                heap = self._expiry_heap
+                while heap and heap[0][0] < cutoff_ns:
+                    _, session_id = heapq.heappop(heap)
+                    bundle = self._sessions.get(session_id)
+                    if bundle is None:
+                        continue  # Session already closed
+                    last_activity_ns = bundle.data.last_activity_ns
+                    if last_activity_ns < cutoff_ns:
                         inactive_sessions.append(session_id)
+                    else:
+                        heapq.heappush(heap, (last_activity_ns, session_id))
 
                 # Close inactive sessions
                 for session_id in inactive_sessions:
-                    logger = SessionLogger(session_id)
-                    logger.info("Closing inactive session (timeout)")
+                    bundle = self._sessions.get(session_id)
+                    if bundle is None:
+                        continue  # Closed elsewhere while this sweep was running
+                    bundle.logger.info("Closing inactive session (timeout)")
                     await self.close_session(session_id)
 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                print(f"Error in session cleanup: {e}")
+            except Exception:
+                logger.exception("Error in session cleanup")
 
     def _on_state_change(
         self,
@@ -325,10 +404,26 @@ class SessionManager:
         new_state: SessionState
     ):
         """Callback when session state changes."""
-        session = self._sessions.get(session_id)
-        if session:
-            session.state = new_state
-            session.last_activity = datetime.utcnow()
+        bundle = self._sessions.get(session_id)
+        if bundle is not None:
+            bundle.data.state = new_state
+            bundle.snapshot.state = new_state
+            self._touch(bundle)
+
+    def _touch(self, bundle: SessionBundle):
+        """Record activity on a session (wall clock for display, monotonic for timeouts)."""
+        session = bundle.data
+        session.last_activity = datetime.utcnow()
+        session.last_activity_ns = time.monotonic_ns()
+        bundle.snapshot.last_activity = session.last_activity
+
+    def _push_expiry(self, session_id: str, last_activity_ns: int):
+        """Queue a session for timeout checks, compacting entries of closed sessions."""
+        heap = self._expiry_heap
+        if len(heap) >= 2 * len(self._sessions):
+            heap[:] = [entry for entry in heap if entry[1] in self._sessions]
+            heapq.heapify(heap)
+        heapq.heappush(heap, (last_activity_ns, session_id))
 
     def _get_session_duration(self, session: SessionData) -> int:
         """Calculate session duration in seconds."""
@@ -336,9 +431,26 @@ class SessionManager:
         return int(duration.total_seconds())
 
     @staticmethod
-    def _update_average(current_avg: float, new_value: float, count: int) -> float:
-        """Update a running average with a new value."""
-        return (current_avg * (count - 1) + new_value) / count
+    def _ema(
+        current_avg: float,
+        new_value: float,
+        alpha: float = _LATENCY_EMA_ALPHA
+    ) -> float:
+        """
+        Update an exponential moving average with a new value.
+
+        Args:
+            current_avg: Current average (0.0 until the metric's first sample)
+            new_value: Newest sample
+            alpha: Weight given to the newest sample
+
+        Returns:
+            Updated average
+        """
+        # Seeded by the metric's own first sample; a stage may be skipped on earlier turns
+        if current_avg == 0.0:
+            return new_value
+        return current_avg + alpha * (new_value - current_avg)
 
 
 # Global session manager instance
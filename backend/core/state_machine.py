@@ -6,10 +6,200 @@ The state machine enforces the strict PTT logic from the PRD:
 - Partner Turn (PTT Released): Partner speaks → Text output in home language
 """
 
-from typing import Optional, Callable
+import inspect
+import logging
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
 from models import SessionState, PTTState, SpeakerTurn
 from utils import SessionLogger
 
+# State groups behind the derived turn flags
+_PARTNER_TURN_STATES = frozenset({SessionState.PARTNER_LISTENING, SessionState.PARTNER_PROCESSING})
+_VAD_STATES = frozenset({SessionState.CONNECTED, SessionState.PARTNER_LISTENING})
+_AUDIO_OUTPUT_STATES = frozenset({SessionState.USER_SPEAKING, SessionState.USER_PROCESSING})
+_USER_ACTIVE_STATES = frozenset({SessionState.USER_SPEAKING, SessionState.USER_PROCESSING})
+
+# Events driven through the transition table
+_EV_PTT_PRESS = 0
+_EV_PTT_RELEASE = 1
+_EV_USER_PROCESSING_START = 2
+_EV_USER_PROCESSING_FINISH = 3
+_EV_PARTNER_PROCESSING_START = 4
+_EV_PARTNER_PROCESSING_FINISH = 5
+
+# Marks a transition that leaves the current speaker unchanged
+_KEEP = object()
+
+_STATE_INDEX = {state: index for index, state in enumerate(SessionState)}
+
+# Fixed log lines, keyed by the transition or lifecycle event that emits them
+_LOG_MESSAGES = {
+    "ptt_press_ignored": "PTT press ignored: session not connected",
+    "ptt_press": "PTT pressed → User turn started",
+    "ptt_release_processing": "PTT released → User processing",
+    "ptt_release_listening": "PTT released → Partner listening mode",
+    "user_processing_start": "User speech processing started",
+    "user_processing_finish": "User processing complete → Partner listening",
+    "partner_processing_start": "Partner speech detected → Partner processing",
+    "partner_processing_finish": "Partner processing complete → Listening",
+    "connected": "Session connected",
+    "disconnected": "Session disconnected",
+    "reset": "State machine reset",
+}
+
+# Enum string values and transition log lines, built once at import
+_STATE_STR = {state: state.value for state in SessionState}
+_SPEAKER_STR = {speaker: speaker.value for speaker in SpeakerTurn}
+_TRANSITION_MESSAGES = {
+    (old, new): f"State transition: {old.value} → {new.value}"
+    for old in SessionState
+    for new in SessionState
+}
+
+
+# Bits of TranslatorStateMachine._flags
+_PTT_BIT = 1
+_PROC_BIT = 2
+
+
+def _flags(ptt_pressed: bool, is_processing: bool) -> int:
+    """Pack the PTT and processing flags into a bitfield."""
+    return (_PTT_BIT if ptt_pressed else 0) | (_PROC_BIT if is_processing else 0)
+
+
+def _pack(state: SessionState, flags: int) -> int:
+    """Pack state and flag bits into a single table key."""
+    return (_STATE_INDEX[state] << 2) | flags
+
+
+def _next(event: int, state: SessionState, ptt_pressed: bool, is_processing: bool):
+    """
+    Transition rules, evaluated once per combination when the table is built.
+
+    Args:
+        event: One of the _EV_* constants
+        state: Current state
+        ptt_pressed: Current PTT flag
+        is_processing: Current processing flag
+
+    Returns:
+        (new_state, ptt_pressed, is_processing, speaker, notify, log) or None if the
+        event is ignored. notify routes the change through _transition_to; log is an
+        optional (level number, logger method, message) emitted after the change.
+    """
+    if event == _EV_PTT_PRESS:
+        # PTT press ALWAYS forces user turn, regardless of current state
+        if state is SessionState.DISCONNECTED:
+            return (state, ptt_pressed, is_processing, _KEEP, False,
+                    (logging.WARNING, "warning", _LOG_MESSAGES["ptt_press_ignored"]))
+        if state is not SessionState.USER_SPEAKING:
+            return (SessionState.USER_SPEAKING, True, is_processing, SpeakerTurn.USER, True,
+                    (logging.INFO, "info", _LOG_MESSAGES["ptt_press"]))
+        return (state, True, is_processing, SpeakerTurn.USER, False, None)
+
+    if event == _EV_PTT_RELEASE:
+        if state is SessionState.DISCONNECTED:
+            return None
+        # If user was speaking and processing is ongoing, move to USER_PROCESSING
+        if state is SessionState.USER_SPEAKING:
+            if is_processing:
+                return (SessionState.USER_PROCESSING, False, is_processing, _KEEP, True,
+                        (logging.INFO, "info", _LOG_MESSAGES["ptt_release_processing"]))
+            return (SessionState.PARTNER_LISTENING, False, is_processing, SpeakerTurn.NONE, True,
+                    (logging.INFO, "info", _LOG_MESSAGES["ptt_release_listening"]))
+        return (state, False, is_processing, _KEEP, False, None)
+
+    if event == _EV_USER_PROCESSING_START:
+        # User still holding PTT stays USER_SPEAKING; after release, now processing.
+        # Both go through _transition_to so listeners see the change.
+        target = SessionState.USER_SPEAKING if ptt_pressed else SessionState.USER_PROCESSING
+        return (target, ptt_pressed, True, _KEEP, True,
+                (logging.DEBUG, "debug", _LOG_MESSAGES["user_processing_start"]))
+
+    if event == _EV_USER_PROCESSING_FINISH:
+        # Transition to partner listening mode
+        if state in _USER_ACTIVE_STATES:
+            return (SessionState.PARTNER_LISTENING, ptt_pressed, False, SpeakerTurn.NONE, True,
+                    (logging.DEBUG, "debug", _LOG_MESSAGES["user_processing_finish"]))
+        return (state, ptt_pressed, False, SpeakerTurn.NONE, False, None)
+
+    if event == _EV_PARTNER_PROCESSING_START:
+        if not ptt_pressed and state in _VAD_STATES:
+            return (SessionState.PARTNER_PROCESSING, ptt_pressed, True, SpeakerTurn.PARTNER, True,
+                    (logging.INFO, "info", _LOG_MESSAGES["partner_processing_start"]))
+        return None
+
+    if event == _EV_PARTNER_PROCESSING_FINISH:
+        # Return to listening mode
+        if state is SessionState.PARTNER_PROCESSING:
+            return (SessionState.PARTNER_LISTENING, ptt_pressed, False, SpeakerTurn.NONE, True,
+                    (logging.DEBUG, "debug", _LOG_MESSAGES["partner_processing_finish"]))
+        return (state, ptt_pressed, False, SpeakerTurn.NONE, False, None)
+
+    return None
+
+
+def _build_transitions() -> dict:
+    """
+    Precompute the (packed key, event) -> transition table, omitting no-ops.
+
+    Entries are (new_state, new_flags, speaker, notify, log).
+    """
+    table = {}
+    for event in range(_EV_PARTNER_PROCESSING_FINISH + 1):
+        for state in SessionState:
+            for ptt_pressed in (False, True):
+                for is_processing in (False, True):
+                    entry = _next(event, state, ptt_pressed, is_processing)
+                    if entry is None or entry == (
+                        state, ptt_pressed, is_processing, _KEEP, False, None
+                    ):
+                        continue
+                    new_state, new_ptt, new_processing, speaker, notify, log = entry
+                    key = (_pack(state, _flags(ptt_pressed, is_processing)), event)
+                    table[key] = (
+                        new_state, _flags(new_ptt, new_processing), speaker, notify, log
+                    )
+    return table
+
+
+_TRANSITIONS = _build_transitions()
+
+
+def _noop_state_change(old_state: SessionState, new_state: SessionState):
+    """Default state change callback; lets transitions call it unconditionally."""
+    return None
+
+
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def _adapt_state_callback(callback: Callable) -> Callable[[SessionState, SessionState], None]:
+    """
+    Resolve a state change callback's arity once, at registration.
+
+    Args:
+        callback: Callable taking (old_state, new_state), (new_state) or no arguments
+
+    Returns:
+        Callable that always accepts (old_state, new_state)
+    """
+    try:
+        params = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        # Signature not introspectable (some builtins); assume the full form
+        return callback
+
+    if any(param.kind is inspect.Parameter.VAR_POSITIONAL for param in params):
+        return callback
+
+    positional = sum(1 for param in params if param.kind in _POSITIONAL_KINDS)
+    if positional >= 2:
+        return callback
+    if positional == 1:
+        return lambda old_state, new_state: callback(new_state)
+    return lambda old_state, new_state: callback()
+
 
 class TranslatorStateMachine:
     """
@@ -26,16 +216,42 @@ class TranslatorStateMachine:
     ANY → DISCONNECTED (on disconnect)
     """
 
+    __slots__ = (
+        "session_id",
+        "logger",
+        "_debug",
+        "_state",
+        "_flags",
+        "_current_speaker",
+        "is_user_turn",
+        "is_partner_turn",
+        "should_enable_vad",
+        "should_output_audio",
+        "_state_info_cache",
+        "_on_state_change",
+    )
+
     def __init__(self, session_id: str, logger: Optional[SessionLogger] = None):
         self.session_id = session_id
         self.logger = logger or SessionLogger(session_id)
+        # Logging is configured at startup, so the debug level check is done once
+        self._debug = self.logger.is_enabled_for(logging.DEBUG)
         self._state = SessionState.DISCONNECTED
-        self._ptt_pressed = False
-        self._is_processing = False
-        self._current_speaker: Optional[SpeakerTurn] = None
+        self._flags = 0  # _PTT_BIT | _PROC_BIT
+        self._current_speaker = SpeakerTurn.NONE
+
+        # Turn flags derived from state and PTT, read on every audio frame.
+        # Plain attributes kept current by _recompute_derived().
+        self.is_user_turn = False
+        self.is_partner_turn = False
+        self.should_enable_vad = False
+        self.should_output_audio = False
+
+        # Read-only get_state_info() result, rebuilt after the next change
+        self._state_info_cache: Optional[Mapping[str, Any]] = None
 
         # State change callbacks
-        self._on_state_change: Optional[Callable[[SessionState, SessionState], None]] = None
+        self._on_state_change: Callable[[SessionState, SessionState], None] = _noop_state_change
 
     @property
     def state(self) -> SessionState:
@@ -43,168 +259,159 @@ class TranslatorStateMachine:
         return self._state
 
     @property
-    def current_speaker(self) -> Optional[SpeakerTurn]:
-        """Get current speaker (user or partner)."""
-        return self._current_speaker
+    def ptt_pressed(self) -> bool:
+        """Check if the PTT button is held."""
+        return bool(self._flags & _PTT_BIT)
 
     @property
-    def is_user_turn(self) -> bool:
-        """Check if it's currently user's turn to speak."""
-        return self._ptt_pressed
+    def is_processing(self) -> bool:
+        """Check if a turn is being processed."""
+        return bool(self._flags & _PROC_BIT)
 
     @property
-    def is_partner_turn(self) -> bool:
-        """Check if it's currently partner's turn to speak."""
-        return not self._ptt_pressed and self._state in [
-            SessionState.PARTNER_LISTENING,
-            SessionState.PARTNER_PROCESSING
-        ]
+    def current_speaker(self) -> SpeakerTurn:
+        """Get current speaker (user, partner, or NONE between turns)."""
+        return self._current_speaker
 
-    @property
-    def should_enable_vad(self) -> bool:
-        """Determine if VAD should be active."""
-        # VAD only active during partner's turn (PTT released)
-        return not self._ptt_pressed and self._state in [
-            SessionState.CONNECTED,
-            SessionState.PARTNER_LISTENING
-        ]
+    def _recompute_derived(self):
+        """Refresh the turn flags after a state or PTT change."""
+        state = self._state
+        ptt_pressed = bool(self._flags & _PTT_BIT)
 
-    @property
-    def should_output_audio(self) -> bool:
-        """Determine if TTS audio should be played."""
+        # User's turn while PTT is held
+        self.is_user_turn = ptt_pressed
+        # Partner's turn while PTT is released and partner is listening/processing
+        self.is_partner_turn = not ptt_pressed and state in _PARTNER_TURN_STATES
+        # VAD only active during partner's turn (PTT released)
+        self.should_enable_vad = not ptt_pressed and state in _VAD_STATES
         # Audio output only during user's turn
-        return self._state in [SessionState.USER_SPEAKING, SessionState.USER_PROCESSING]
+        self.should_output_audio = state in _AUDIO_OUTPUT_STATES
+
+        self._state_info_cache = None
+
+    def set_on_state_change(self, callback: Optional[Callable[..., None]]):
+        """
+        Set callback for state changes.
 
-    def set_on_state_change(self, callback: Callable[[SessionState, SessionState], None]):
-        """Set callback for state changes."""
-        self._on_state_change = callback
+        Callbacks may take (old_state, new_state), (new_state) or no arguments;
+        the form is resolved here rather than on every transition.
+        """
+        if callback is None:
+            self._on_state_change = _noop_state_change
+        else:
+            self._on_state_change = _adapt_state_callback(callback)
 
     def connect(self):
         """Transition to connected state."""
-        self._transition_to(SessionState.CONNECTED)
-        self.logger.info("Session connected")
+        if self._state is not SessionState.CONNECTED:
+            self._transition_to(SessionState.CONNECTED)
+        self.logger.info(_LOG_MESSAGES["connected"])
 
     def disconnect(self):
         """Transition to disconnected state."""
-        self._transition_to(SessionState.DISCONNECTED)
-        self._ptt_pressed = False
-        self._is_processing = False
-        self._current_speaker = None
-        self.logger.info("Session disconnected")
+        if self._state is not SessionState.DISCONNECTED:
+            self._transition_to(SessionState.DISCONNECTED)
+        self._flags = 0
+        self._current_speaker = SpeakerTurn.NONE
+        self._recompute_derived()
+        self.logger.info(_LOG_MESSAGES["disconnected"])
 
     def handle_ptt_press(self):
         """
         Handle PTT button press event.
         Forces transition to USER_SPEAKING state (strict PTT override).
         """
-        if self._state == SessionState.DISCONNECTED:
-            self.logger.warning("PTT press ignored: session not connected")
-            return
-
-        self._ptt_pressed = True
-        self._current_speaker = SpeakerTurn.USER
-
-        # PTT press ALWAYS forces user turn, regardless of current state
-        if self._state != SessionState.USER_SPEAKING:
-            self._transition_to(SessionState.USER_SPEAKING)
-            self.logger.info("PTT pressed → User turn started")
+        self._fire(_EV_PTT_PRESS)
 
     def handle_ptt_release(self):
         """
         Handle PTT button release event.
         Transitions to partner listening mode.
         """
-        if self._state == SessionState.DISCONNECTED:
-            return
-
-        self._ptt_pressed = False
-
-        # If user was speaking and processing is ongoing, move to USER_PROCESSING
-        if self._state == SessionState.USER_SPEAKING:
-            if self._is_processing:
-                self._transition_to(SessionState.USER_PROCESSING)
-                self.logger.info("PTT released → User processing")
-            else:
-                self._transition_to(SessionState.PARTNER_LISTENING)
-                self._current_speaker = None
-                self.logger.info("PTT released → Partner listening mode")
+        self._fire(_EV_PTT_RELEASE)
 
     def start_user_processing(self):
         """Mark that user speech processing has started."""
-        self._is_processing = True
-
-        if self._ptt_pressed:
-            # User still holding PTT
-            self._state = SessionState.USER_SPEAKING
-        else:
-            # User released PTT, now processing
-            self._transition_to(SessionState.USER_PROCESSING)
-
-        self.logger.debug("User speech processing started")
+        self._fire(_EV_USER_PROCESSING_START)
 
     def finish_user_processing(self):
         """Mark that user speech processing has completed."""
-        self._is_processing = False
-        self._current_speaker = None
-
-        # Transition to partner listening mode
-        if self._state in [SessionState.USER_SPEAKING, SessionState.USER_PROCESSING]:
-            self._transition_to(SessionState.PARTNER_LISTENING)
-            self.logger.debug("User processing complete → Partner listening")
+        self._fire(_EV_USER_PROCESSING_FINISH)
 
     def start_partner_processing(self):
         """Mark that partner speech has been detected and processing started."""
-        if not self._ptt_pressed and self.should_enable_vad:
-            self._is_processing = True
-            self._current_speaker = SpeakerTurn.PARTNER
-            self._transition_to(SessionState.PARTNER_PROCESSING)
-            self.logger.info("Partner speech detected → Partner processing")
+        self._fire(_EV_PARTNER_PROCESSING_START)
 
     def finish_partner_processing(self):
         """Mark that partner speech processing has completed."""
-        self._is_processing = False
-        self._current_speaker = None
+        self._fire(_EV_PARTNER_PROCESSING_FINISH)
+
+    def _fire(self, event: int):
+        """Apply the precomputed transition for an event in the current state."""
+        entry = _TRANSITIONS.get(
+            ((_STATE_INDEX[self._state] << 2) | self._flags, event)
+        )
+        if entry is None:
+            return
 
-        # Return to listening mode
-        if self._state == SessionState.PARTNER_PROCESSING:
-            self._transition_to(SessionState.PARTNER_LISTENING)
-            self.logger.debug("Partner processing complete → Listening")
+        new_state, self._flags, speaker, notify, log = entry
+        if speaker is not _KEEP:
+            self._current_speaker = speaker
+
+        if notify and new_state is not self._state:
+            self._transition_to(new_state)
+        else:
+            self._state = new_state
+            self._recompute_derived()
+
+        if log is not None and (self._debug or log[0] > logging.DEBUG):
+            getattr(self.logger, log[1])(log[2])
 
     def handle_error(self, error_message: str):
         """Transition to error state."""
-        self.logger.error(f"State machine error: {error_message}")
-        self._transition_to(SessionState.ERROR)
-        self._is_processing = False
+        self.logger.error("State machine error: {}", error_message)
+        if self._state is not SessionState.ERROR:
+            self._transition_to(SessionState.ERROR)
+        self._flags &= ~_PROC_BIT
+        self._state_info_cache = None
 
     def _transition_to(self, new_state: SessionState):
-        """Internal method to transition to a new state."""
-        if new_state == self._state:
+        """
+        Internal method to transition to a new state.
+
+        Callers check for the no-change case first so repeated events skip this call.
+        """
+        if new_state is self._state:
             return
 
         old_state = self._state
         self._state = new_state
+        self._recompute_derived()
 
-        self.logger.debug(f"State transition: {old_state.value} → {new_state.value}")
+        if self._debug:
+            self.logger.debug(_TRANSITION_MESSAGES[old_state, new_state])
 
-        # Invoke callback if registered
-        if self._on_state_change:
-            self._on_state_change(old_state, new_state)
+        # Invoke callback (no-op unless one is registered)
+        self._on_state_change(old_state, new_state)
 
     def reset(self):
         """Reset state machine to initial state."""
         self._state = SessionState.CONNECTED
-        self._ptt_pressed = False
-        self._is_processing = False
-        self._current_speaker = None
-        self.logger.info("State machine reset")
-
-    def get_state_info(self) -> dict:
-        """Get current state information for debugging."""
-        return {
-            "state": self._state.value,
-            "ptt_pressed": self._ptt_pressed,
-            "is_processing": self._is_processing,
-            "current_speaker": self._current_speaker.value if self._current_speaker else None,
-            "should_enable_vad": self.should_enable_vad,
-            "should_output_audio": self.should_output_audio,
-        }
+        self._flags = 0
+        self._current_speaker = SpeakerTurn.NONE
+        self._recompute_derived()
+        self.logger.info(_LOG_MESSAGES["reset"])
+
+    def get_state_info(self) -> Mapping[str, Any]:
+        """Get current state information for debugging (read-only, cached until the next change)."""
+        info = self._state_info_cache
+        if info is None:
+            info = self._state_info_cache = MappingProxyType({
+                "state": _STATE_STR[self._state],
+                "ptt_pressed": bool(self._flags & _PTT_BIT),
+                "is_processing": bool(self._flags & _PROC_BIT),
+                "current_speaker": _SPEAKER_STR[self._current_speaker],
+                "should_enable_vad": self.should_enable_vad,
+                "should_output_audio": self.should_output_audio,
+            })
+        return info
@@ -4,10 +4,17 @@ Real-time voice translation with Pipecat
 """
 
 import asyncio
+import copy
+import json
+import logging
+import time
+import httpx
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from config import settings, get_webrtc_config
 from models import (
@@ -17,12 +24,20 @@ from models import (
     LanguageCode,
     WebRTCOffer,
     WebRTCAnswer,
-    ICECandidate
+    ICECandidate,
+    WebRTCOfferRequest,
+    WebRTCPatchRequest,
+    SessionSnapshot,
+    PTTMessage,
+    PTTState,
+    MessageType,
+    LANGUAGE_NAMES_ITEMS
 )
 from pipecat.transports.smallwebrtc.request_handler import (
     SmallWebRTCRequestHandler,
     SmallWebRTCRequest,
     SmallWebRTCPatchRequest,
+    IceCandidate,
     IceServer,
     ConnectionMode
 )
@@ -31,7 +46,14 @@ from pipecat.transports.base_transport import TransportParams
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineTask
-from core import get_session_manager, PipelineManager
+from core import get_session_manager, PipelineManager, PipelineBundle
+from core.pipeline_manager import (
+    AudioRouterProcessor,
+    TextRouterProcessor,
+    AudioLevelMonitor,
+    VADLogger,
+    PipelineReadyMarker
+)
 from services import (
     STTServiceFactory,
     TTSServiceFactory,
@@ -41,21 +63,75 @@ from services import (
     validate_tts_config,
     validate_translation_config,
     validate_vad_config,
+    list_supported_models,
+    list_available_voices,
 )
-from utils import setup_logging, get_logger
+from utils import setup_logging, get_logger, is_enabled_for, IceCandidateBatcher
 
 # Initialize logging
 setup_logging()
 logger = get_logger(__name__)
 
+# Process-wide session manager, resolved once for all endpoints
+session_manager = get_session_manager()
+
+# (message type, PTT state) -> pipeline manager handler
+_PTT_HANDLERS = {
+    (MessageType.PTT_STATE, PTTState.PRESSED): PipelineManager.handle_ptt_press,
+    (MessageType.PTT_STATE, PTTState.RELEASED): PipelineManager.handle_ptt_release,
+}
+
+# Upper bound on waiting for the StartFrame to reach the end of a new pipeline
+_PIPELINE_READY_TIMEOUT_SECONDS = 2.0
+
+# Transport mode is fixed for the process lifetime
+_IS_WEBRTC = settings.transport_mode.value == "webrtc"
+
 # Global WebRTC request handler
 webrtc_request_handler: SmallWebRTCRequestHandler | None = None
 
+# Limits concurrent WebRTC offer negotiations (created in lifespan)
+offer_semaphore: asyncio.Semaphore | None = None
+
+# ICE candidates arrive in bursts of single-candidate PATCH requests while the
+# browser gathers; they are coalesced per peer connection (created in lifespan)
+ice_batcher: IceCandidateBatcher | None = None
+
+
+def _build_ice_servers() -> tuple[IceServer, ...]:
+    """
+    Build the ICE servers used by the WebRTC request handler.
+
+    Returns:
+        STUN server, followed by the TURN server when one is configured
+    """
+    ice_servers = [IceServer(urls=[settings.stun_server_url])]
+
+    if settings.turn_server_url:
+        ice_servers.append(
+            IceServer(
+                urls=[settings.turn_server_url],
+                username=settings.turn_username,
+                credential=settings.turn_credential
+            )
+        )
+
+    return tuple(ice_servers)
+
+
+# ICE servers depend only on settings, so they are built once at import
+_ICE_SERVERS = _build_ice_servers()
+
+# Batch serializer for session listings
+_SESSIONS_ADAPTER = TypeAdapter(list[SessionSnapshot])
+# Listings larger than this are serialized off the event loop
+_SESSIONS_THREADPOOL_THRESHOLD = 256
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global webrtc_request_handler
+    global webrtc_request_handler, offer_semaphore, ice_batcher
 
     # Startup
     logger.info("Starting Nebula Translate backend...")
@@ -71,38 +147,30 @@ async def lifespan(app: FastAPI):
         logger.error(f"Configuration validation failed: {e}")
         raise
 
+    # One HTTP client (and connection pool) shared by all translation processors
+    app.state.translation_http_client = httpx.AsyncClient(
+        timeout=settings.translation_timeout_seconds,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=256)
+    )
+
     # Start session manager
-    session_manager = get_session_manager()
     await session_manager.start()
     logger.info("Session manager started")
 
     # Initialize SmallWebRTC request handler for WebRTC transport
-    if settings.transport_mode.value == "webrtc":
+    if _IS_WEBRTC:
         logger.info("Initializing WebRTC request handler...")
 
-        # Prepare ICE servers
-        ice_servers_config = []
-
-        # Add STUN server
-        ice_servers_config.append(IceServer(urls=[settings.stun_server_url]))
-
-        # Add TURN server if configured
-        if settings.turn_server_url:
-            ice_servers_config.append(
-                IceServer(
-                    urls=[settings.turn_server_url],
-                    username=settings.turn_username,
-                    credential=settings.turn_credential
-                )
-            )
-
         # Create request handler
         webrtc_request_handler = SmallWebRTCRequestHandler(
-            ice_servers=ice_servers_config,
+            ice_servers=list(_ICE_SERVERS),
             connection_mode=ConnectionMode.MULTIPLE  # Support multiple concurrent sessions
         )
 
-        logger.info(f"WebRTC request handler initialized with {len(ice_servers_config)} ICE servers")
+        offer_semaphore = asyncio.Semaphore(settings.max_concurrent_offers)
+        ice_batcher = IceCandidateBatcher(_apply_ice_candidates)
+
+        logger.info("WebRTC request handler initialized with {} ICE servers", len(_ICE_SERVERS))
 
     logger.info(f"Backend running on {settings.host}:{settings.port}")
     logger.info(f"Environment: {settings.environment.value}")
@@ -113,14 +181,23 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Nebula Translate backend...")
 
+    # Apply candidates still being coalesced before the handler goes away
+    if ice_batcher:
+        await ice_batcher.close()
+        ice_batcher = None
+
     # Close WebRTC request handler if initialized
     if webrtc_request_handler:
         await webrtc_request_handler.close()
         logger.info("WebRTC request handler closed")
 
     await session_manager.stop()
+    await app.state.translation_http_client.aclose()
     logger.info("Backend shutdown complete")
 
+    # Drain records still queued for the background log writer
+    await logger.complete()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -140,21 +217,40 @@ app.add_middleware(
 )
 
 
+def _encode_json(content) -> bytes:
+    """Encode a payload exactly as JSONResponse would render it."""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+# ICE configuration sent with new sessions (WebRTC mode only), built once per process.
+# Never mutated; each response gets its own copy.
+_WEBRTC_CONFIG = get_webrtc_config() if _IS_WEBRTC else None
+
+# Health check fields fixed for the process lifetime (active_sessions filled per request)
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "version": "1.0.0",
+    "environment": settings.environment.value,
+    "transport_mode": settings.transport_mode.value,
+    "active_sessions": 0,
+    "max_sessions": settings.max_sessions,
+}
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    session_manager = get_session_manager()
-    active_sessions = len(session_manager.list_sessions())
-
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "environment": settings.environment.value,
-        "transport_mode": settings.transport_mode.value,
-        "active_sessions": active_sessions,
-        "max_sessions": settings.max_sessions,
-    }
+    return JSONResponse({
+        **_HEALTH_STATIC,
+        "active_sessions": session_manager.active_count(),
+    })
 
 
 # Session management endpoints
@@ -170,8 +266,6 @@ async def create_session(request: SessionCreateRequest):
         Session ID and configuration
     """
     try:
-        session_manager = get_session_manager()
-
         # Create session
         session = session_manager.create_session(
             home_language=request.home_language,
@@ -187,17 +281,12 @@ async def create_session(request: SessionCreateRequest):
             user_id=session.user_id
         )
 
-        # Include WebRTC config if in WebRTC mode
-        webrtc_config = None
-        if settings.transport_mode.value == "webrtc":
-            webrtc_config = get_webrtc_config()
-
-        logger.info(f"Session created: {session.session_id}")
+        logger.info("Session created: {}", session.session_id)
 
         return SessionCreateResponse(
             session_id=session.session_id,
             config=config,
-            webrtc_config=webrtc_config
+            webrtc_config=copy.deepcopy(_WEBRTC_CONFIG)
         )
 
     except RuntimeError as e:
@@ -221,7 +310,6 @@ async def delete_session(session_id: str):
         Success message
     """
     try:
-        session_manager = get_session_manager()
         session = session_manager.get_session(session_id)
 
         if not session:
@@ -242,16 +330,36 @@ async def delete_session(session_id: str):
 
 
 @app.get("/api/sessions")
-async def list_sessions():
-    """List all active sessions."""
-    try:
-        session_manager = get_session_manager()
-        sessions = session_manager.list_sessions()
+async def list_sessions(
+    offset: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1)
+):
+    """
+    List active sessions.
 
-        return {
-            "sessions": [s.dict() for s in sessions],
-            "count": len(sessions)
-        }
+    Args:
+        offset: Number of sessions to skip
+        limit: Maximum number of sessions to return (all if omitted)
+
+    Returns:
+        Page of sessions, its size, and the total number of active sessions
+    """
+    try:
+        sessions = session_manager.list_sessions(offset=offset, limit=limit)
+
+        # Serialize straight to JSON bytes and splice them into the envelope,
+        # so the list is never re-encoded by the response class
+        if len(sessions) > _SESSIONS_THREADPOOL_THRESHOLD:
+            # The loop keeps updating the live snapshots, so the worker gets copies
+            frozen = [snapshot.model_copy() for snapshot in sessions]
+            payload = await run_in_threadpool(_SESSIONS_ADAPTER.dump_json, frozen)
+        else:
+            payload = _SESSIONS_ADAPTER.dump_json(sessions)
+
+        body = b'{"sessions":%b,"count":%d,"total":%d}' % (
+            payload, len(sessions), session_manager.active_count()
+        )
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error listing sessions: {e}")
@@ -268,7 +376,6 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
         webrtc_connection: SmallWebRTCConnection instance
     """
     try:
-        session_manager = get_session_manager()
         state_machine = session_manager.get_state_machine(session.session_id)
 
         if not state_machine:
@@ -278,10 +385,12 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
         # Create pipeline manager for PTT routing logic (before transport)
         pipeline_manager = PipelineManager(
             session=session,
-            state_machine=state_machine
+            state_machine=state_machine,
+            logger=state_machine.logger
         )
 
-        # Create VAD processor FIRST (needed for TransportParams)
+        # Create VAD processor FIRST (needed for TransportParams).
+        # Processors may bind the running loop when constructed, so they are built on it.
         vad_processor = VADServiceFactory.create_vad_processor(
             session_id=session.session_id
         )
@@ -303,35 +412,24 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
             params=transport_params
         )
 
-        # Register callbacks to send data via WebRTC data channels
+        # Register callbacks to send data via WebRTC data channels.
+        # The transport wraps this connection, so its sender is resolved once here.
+        send_app_message = webrtc_connection.send_app_message
+
         def on_text_output(text: str, speaker: str):
             """Send translated text to frontend via RTVI server message."""
-            try:
-                logger.info(f"[CALLBACK] on_text_output CALLED: text='{text}', speaker={speaker}")
-
-                # Get WebRTC connection from transport
-                connection = transport._client._webrtc_connection
-
-                # Send RTVI-formatted server message directly through data channel
-                # Format: {"label": "rtvi-ai", "type": "server-message", "data": {...}}
-                rtvi_message = {
-                    "label": "rtvi-ai",
-                    "type": "server-message",
-                    "data": {
-                        "type": "translation",
-                        "text": text,
-                        "speaker": speaker
-                    }
+            # Send RTVI-formatted server message directly through data channel
+            # Format: {"label": "rtvi-ai", "type": "server-message", "data": {...}}
+            # Send errors are logged by PipelineManager, which dispatches this callback.
+            send_app_message({
+                "label": "rtvi-ai",
+                "type": "server-message",
+                "data": {
+                    "type": "translation",
+                    "text": text,
+                    "speaker": speaker
                 }
-
-                logger.info(f"[CALLBACK] Sending RTVI server-message via data channel")
-
-                # Send through data channel
-                connection.send_app_message(rtvi_message)
-
-                logger.info(f"[CALLBACK] ✅ RTVI message sent successfully for: '{text}' (speaker={speaker})")
-            except Exception as e:
-                logger.error(f"[CALLBACK] ❌ Error sending text output: {e}", exc_info=True)
+            })
 
         def on_audio_level(level: float, speaker: str):
             """Send audio level to frontend via WebRTC data channel."""
@@ -348,14 +446,10 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
 
         def on_thinking(is_thinking: bool):
             """Send thinking indicator to frontend via WebRTC data channel."""
-            try:
-                transport._client._webrtc_connection.send_app_message({
-                    "type": "thinking",
-                    "is_thinking": is_thinking
-                })
-                logger.info(f"[WebRTC] Sent thinking indicator: {is_thinking}")
-            except Exception as e:
-                logger.error(f"[WebRTC] Error sending thinking indicator: {e}")
+            send_app_message({
+                "type": "thinking",
+                "is_thinking": is_thinking
+            })
 
         # Register client connection handler
         @transport.event_handler("on_client_connected")
@@ -384,43 +478,35 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
         async def on_ptt_message(transport, message, sender):
             """Handle PTT messages from frontend."""
             try:
-                logger.info(f"[PTT_HANDLER] Received app message: {message}")
-                if isinstance(message, dict):
-                    msg_type = message.get('type')
-                    logger.info(f"[PTT_HANDLER] Message type: {msg_type}")
-
-                    # Unwrap RTVI format: {"type": "client-message", "data": {...}}
-                    if msg_type == 'client-message':
-                        # Extract the actual message from the data field
-                        actual_message = message.get('data', {})
-                        logger.info(f"[PTT_HANDLER] Unwrapped RTVI message, actual data: {actual_message}")
-
-                        # Check if there's another layer with shorthand keys ('t' and 'd')
-                        if 't' in actual_message and 'd' in actual_message:
-                            # Double-wrapped with shorthand: {'t': 'client-message', 'd': {...}}
-                            inner_message = actual_message.get('d', {})
-                            logger.info(f"[PTT_HANDLER] Found double-wrapped message with shorthand, inner data: {inner_message}")
-                            msg_type = inner_message.get('type')
-                            message = inner_message
-                        else:
-                            # Single wrapped: directly use the data
-                            msg_type = actual_message.get('type')
-                            message = actual_message
-
-                    # Now check the actual message type
-                    if msg_type == 'ptt_state':
-                        ptt_state = message.get('state')
-                        logger.info(f"[PTT_HANDLER] PTT state: {ptt_state}")
-                        if ptt_state == 'pressed':
-                            await pipeline_manager.handle_ptt_press()
-                            logger.info(f"[PTT_HANDLER] ✅ PTT PRESSED (session={session.session_id})")
-                        elif ptt_state == 'released':
-                            await pipeline_manager.handle_ptt_release()
-                            logger.info(f"[PTT_HANDLER] ✅ PTT RELEASED (session={session.session_id})")
-                    else:
-                        logger.info(f"[PTT_HANDLER] Unknown message type: {msg_type}")
+                # Unwrap RTVI format: {"type": "client-message", "data": {...}}
+                if message['type'] == 'client-message':
+                    message = message.get('data', {})
+
+                    # Double-wrapped with shorthand keys: {'t': 'client-message', 'd': {...}}
+                    if 't' in message and 'd' in message:
+                        message = message['d']
+
+                # PTTMessage defaults its type, so an untyped payload is not a PTT message
+                ptt_message = PTTMessage.model_validate(message) if 'type' in message else None
+            except (KeyError, TypeError, ValidationError):
+                ptt_message = None
+
+            if ptt_message is None:
+                logger.debug("[PTT_HANDLER] Ignoring non-PTT app message: {}", message)
+                return
+
+            handler = _PTT_HANDLERS.get((ptt_message.type, ptt_message.state))
+            if handler is None:
+                return
+
+            try:
+                await handler(pipeline_manager)
+                logger.info(
+                    "[PTT_HANDLER] PTT {} (session={})",
+                    ptt_message.state.value, session.session_id
+                )
             except Exception as e:
-                logger.error(f"[PTT_HANDLER] ❌ Error handling PTT message: {e}", exc_info=True)
+                logger.exception("[PTT_HANDLER] ❌ Error handling PTT message: {}", e)
 
         # Create service processors
         stt_processor = STTServiceFactory.create_stt_processor(
@@ -436,7 +522,8 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
         translation_processor = TranslationServiceFactory.create_translation_processor(
             source_language=session.home_language,
             target_language=session.target_language,
-            session_id=session.session_id
+            session_id=session.session_id,
+            http_client=app.state.translation_http_client
         )
 
         # Set services in pipeline manager
@@ -454,12 +541,12 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
         logger.info("[WebRTC] Pipeline callbacks registered for data channel communication")
 
         # Build pipeline with transport and PTT routing processors
-        from core.pipeline_manager import AudioRouterProcessor, TextRouterProcessor, AudioLevelMonitor, VADLogger
-
         audio_router = AudioRouterProcessor(pipeline_manager)
         text_router = TextRouterProcessor(pipeline_manager)
         audio_level_monitor = AudioLevelMonitor(pipeline_manager)
         vad_logger = VADLogger(pipeline_manager)
+        pipeline_ready = asyncio.Event()
+        ready_marker = PipelineReadyMarker(pipeline_ready)
 
         pipeline = Pipeline([
             transport.input(),           # WebRTC audio input (VAD handled by transport)
@@ -470,16 +557,21 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
             translation_processor,       # Translation
             text_router,                 # Route text based on state
             tts_processor,               # Text-to-speech (only for user turn)
+            ready_marker,                # Signals StartFrame reached the end
             transport.output(),          # WebRTC audio output
         ])
 
-        # Log pipeline structure for debugging
-        logger.info("[PIPELINE] Pipeline created with the following processors:")
-        for i, proc in enumerate(pipeline.processors):
-            proc_name = proc.__class__.__name__
-            prev_name = proc.previous.__class__.__name__ if proc.previous else "None"
-            next_name = proc.next.__class__.__name__ if proc.next else "None"
-            logger.info(f"  [{i}] {proc_name} (prev={prev_name}, next={next_name})")
+        # Log pipeline structure for debugging (one record, built only when enabled)
+        if is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "[PIPELINE] Pipeline created with the following processors:\n{}",
+                "\n".join(
+                    f"  [{i}] {proc.__class__.__name__} "
+                    f"(prev={proc.previous.__class__.__name__ if proc.previous else 'None'}, "
+                    f"next={proc.next.__class__.__name__ if proc.next else 'None'})"
+                    for i, proc in enumerate(pipeline.processors)
+                )
+            )
 
         # Create and run pipeline task
         task = PipelineTask(pipeline)
@@ -489,24 +581,37 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
         # This allows the WebRTC callback to complete and return the answer
         pipeline_task = asyncio.create_task(runner.run(task))
 
-        # Wait to allow StartFrame to propagate through the pipeline
-        # This prevents the race condition where audio arrives before processors are initialized
-        # The runner.run() task immediately sends StartFrame down the pipeline,
-        # With 11 processors and logging overhead, we need ~1.5s to ensure all processors receive StartFrame
-        logger.info("[PIPELINE] Waiting 1.5s for StartFrame to propagate through all 11 processors...")
-        await asyncio.sleep(1.5)
-        logger.info("[PIPELINE] StartFrame propagation wait complete, pipeline should be ready")
-        logger.info(f"Pipeline initialization wait completed for session: {session.session_id}")
+        # Wait for StartFrame to propagate through the pipeline
+        # This prevents the race condition where audio arrives before processors are initialized.
+        # The runner is watched too, so a pipeline that fails on startup is reported at once.
+        ready_waiter = asyncio.create_task(pipeline_ready.wait())
+        done, _ = await asyncio.wait(
+            {ready_waiter, pipeline_task},
+            timeout=_PIPELINE_READY_TIMEOUT_SECONDS,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        if ready_waiter in done:
+            logger.info(f"[PIPELINE] StartFrame reached the end of the pipeline for session: {session.session_id}")
+        else:
+            ready_waiter.cancel()
+            if pipeline_task in done:
+                # Surface the runner's error (or report a clean early exit)
+                pipeline_task.result()
+                raise RuntimeError("Pipeline stopped before it started")
+            logger.warning(
+                f"[PIPELINE] StartFrame not seen after {_PIPELINE_READY_TIMEOUT_SECONDS}s "
+                f"for session: {session.session_id}, continuing"
+            )
 
         # Store runner, task, and pipeline manager in session for cleanup
-        session_manager._pipelines[session.session_id] = {
-            'pipeline': pipeline,
-            'task': task,
-            'runner': runner,
-            'transport': transport,
-            'background_task': pipeline_task,
-            'pipeline_manager': pipeline_manager
-        }
+        session_manager.register_pipeline(session.session_id, PipelineBundle(
+            pipeline=pipeline,
+            task=task,
+            runner=runner,
+            transport=transport,
+            background_task=pipeline_task,
+            pipeline_manager=pipeline_manager
+        ))
 
         logger.info(f"WebRTC pipeline setup completed for session: {session.session_id}")
 
@@ -515,37 +620,73 @@ async def setup_webrtc_pipeline(session, webrtc_connection):
         raise
 
 
-# WebRTC endpoints for SmallWebRTC transport
-@app.post("/api/webrtc/offer")
-async def handle_webrtc_offer(request: dict):
+def _release_if_acquired(acquire: asyncio.Task):
+    """Hand back an offer slot whose acquire completed after its waiter gave up."""
+    if not acquire.cancelled() and acquire.exception() is None:
+        offer_semaphore.release()
+
+
+async def _acquire_offer_slot(timeout: float) -> bool:
+    """
+    Wait up to ``timeout`` seconds for a free offer negotiation slot.
+
+    Unlike wait_for(semaphore.acquire()) before Python 3.12, a slot acquired
+    just as the wait times out or is cancelled is released instead of leaked.
+
+    Args:
+        timeout: Seconds to wait for a slot
+
+    Returns:
+        True if a slot was acquired (the caller must release it), False on timeout
+    """
+    if not offer_semaphore.locked():
+        # A slot is free, so this returns without suspending
+        return await offer_semaphore.acquire()
+
+    acquire = asyncio.create_task(offer_semaphore.acquire())
+    try:
+        done, _ = await asyncio.wait({acquire}, timeout=timeout)
+    except asyncio.CancelledError:
+        acquire.cancel()
+        acquire.add_done_callback(_release_if_acquired)
+        raise
+
+    if done:
+        return True
+
+    acquire.cancel()
+    acquire.add_done_callback(_release_if_acquired)
+    return False
+
+
+# WebRTC endpoints for SmallWebRTC transport (registered below in WebRTC mode only)
+async def handle_webrtc_offer(request: WebRTCOfferRequest):
     """
     Handle WebRTC offer from client using Pipecat SmallWebRTC.
 
     Args:
-        request: SmallWebRTC request dict containing sdp, type, pc_id, request_data
+        request: SmallWebRTC offer containing sdp, type, pc_id, request_data
 
     Returns:
         WebRTC answer with sdp, type, and pc_id
     """
     try:
-        if not webrtc_request_handler:
-            raise HTTPException(
-                status_code=503,
-                detail="WebRTC not enabled. Set TRANSPORT_MODE=webrtc in .env"
-            )
-
-        # Parse SmallWebRTC request
-        webrtc_request = SmallWebRTCRequest.from_dict(request)
+        # Build SmallWebRTC request from the validated body
+        webrtc_request = SmallWebRTCRequest(
+            sdp=request.sdp,
+            type=request.type,
+            pc_id=request.pc_id,
+            restart_pc=request.restart_pc,
+            request_data=request.request_data
+        )
 
         # Extract session_id from request_data
-        request_data = webrtc_request.request_data or {}
-        session_id = request_data.get("session_id")
+        session_id = request.request_data.get("session_id")
 
         if not session_id:
             raise HTTPException(status_code=400, detail="session_id required in request_data")
 
         # Get session
-        session_manager = get_session_manager()
         session = session_manager.get_session(session_id)
 
         if not session:
@@ -559,15 +700,29 @@ async def handle_webrtc_offer(request: dict):
             # Setup pipeline with this WebRTC connection
             await setup_webrtc_pipeline(session, webrtc_connection)
 
-        # Handle the WebRTC request and get answer
-        answer = await webrtc_request_handler.handle_web_request(
-            webrtc_request,
-            on_webrtc_connection
-        )
+        # Wait briefly for a negotiation slot; shed load instead of queueing indefinitely
+        if not await _acquire_offer_slot(settings.offer_queue_timeout_seconds):
+            logger.warning(f"WebRTC offer rejected, server busy (session: {session_id})")
+            raise HTTPException(status_code=503, detail="Server busy, retry shortly")
+
+        # Handle the WebRTC request and get answer (timed: SDP negotiation plus pipeline setup)
+        started_ns = time.monotonic_ns()
+        try:
+            answer = await webrtc_request_handler.handle_web_request(
+                webrtc_request,
+                on_webrtc_connection
+            )
+        finally:
+            offer_semaphore.release()
+        elapsed_ms = (time.monotonic_ns() - started_ns) / 1_000_000
 
-        logger.info(f"WebRTC offer processed for session: {session_id}, pc_id: {answer.get('pc_id')}")
+        logger.info(
+            "WebRTC offer processed for session: {}, pc_id: {} ({:.1f} ms)",
+            session_id, answer.get('pc_id'), elapsed_ms
+        )
 
-        return answer  # Returns {sdp, type, pc_id}
+        # Already plain JSON types; skip FastAPI's jsonable_encoder pass over the SDP
+        return JSONResponse(answer)  # {sdp, type, pc_id}
 
     except HTTPException:
         raise
@@ -576,52 +731,41 @@ async def handle_webrtc_offer(request: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.patch("/api/webrtc/offer")
-async def handle_webrtc_patch(request: dict):
+async def _apply_ice_candidates(pc_id: str, candidates: list[IceCandidate]):
+    """Submit one batch of ICE candidates for a peer connection as a single patch request."""
+    await webrtc_request_handler.handle_patch_request(
+        SmallWebRTCPatchRequest(pc_id=pc_id, candidates=candidates)
+    )
+    logger.debug("ICE candidates added for pc_id: {} (batch of {})", pc_id, len(candidates))
+
+
+async def handle_webrtc_patch(request: WebRTCPatchRequest):
     """
     Handle WebRTC PATCH request for ICE candidates.
 
     Args:
-        request: Patch request dict containing pc_id and candidates
+        request: Patch request containing pc_id and candidates
 
     Returns:
-        Success status
+        Success status once the batch holding the candidates is applied
     """
     try:
-        if not webrtc_request_handler:
-            raise HTTPException(
-                status_code=503,
-                detail="WebRTC not enabled. Set TRANSPORT_MODE=webrtc in .env"
+        # Convert validated candidates (snake_case or camelCase on the wire) to IceCandidate objects
+        pc_id = request.pc_id
+        candidates = [
+            IceCandidate(
+                candidate=cand.candidate,
+                sdp_mid=cand.sdp_mid,
+                sdp_mline_index=cand.sdp_mline_index
             )
+            for cand in request.candidates
+        ]
 
-        # Parse PATCH request - manually construct IceCandidate objects
-        from pipecat.transports.smallwebrtc.request_handler import IceCandidate
-
-        pc_id = request.get("pc_id") or request.get("pcId")
-        candidates_data = request.get("candidates", [])
-
-        # Convert candidate dicts to IceCandidate objects
-        candidates = []
-        for cand_dict in candidates_data:
-            # Handle both snake_case and camelCase field names
-            candidate = IceCandidate(
-                candidate=cand_dict.get("candidate"),
-                sdp_mid=cand_dict.get("sdp_mid") or cand_dict.get("sdpMid"),
-                sdp_mline_index=cand_dict.get("sdp_mline_index") or cand_dict.get("sdpMLineIndex")
-            )
-            candidates.append(candidate)
-
-        patch_request = SmallWebRTCPatchRequest(
-            pc_id=pc_id,
-            candidates=candidates
-        )
-
-        # Handle ICE candidates
-        await webrtc_request_handler.handle_patch_request(patch_request)
-
-        logger.debug(f"ICE candidates added for pc_id: {patch_request.pc_id}")
+        # Queue into the peer connection's batch (the first candidate opens the window)
+        # and wait until the batch is applied, so its error reaches every contributor
+        await asyncio.shield(ice_batcher.add(pc_id, candidates))
 
-        return {"status": "success"}
+        return JSONResponse({"status": "success"})
 
     except HTTPException:
         raise
@@ -630,7 +774,6 @@ async def handle_webrtc_patch(request: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/webrtc/ice-candidate")
 async def handle_ice_candidate(candidate: ICECandidate):
     """
     Handle ICE candidate from client (legacy endpoint - kept for compatibility).
@@ -653,59 +796,64 @@ async def handle_ice_candidate(candidate: ICECandidate):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Outside WebRTC mode these paths are left unrouted, so probes get a 404 from the router
+if _IS_WEBRTC:
+    app.post("/api/webrtc/offer")(handle_webrtc_offer)
+    app.patch("/api/webrtc/offer")(handle_webrtc_patch)
+    app.post("/api/webrtc/ice-candidate")(handle_ice_candidate)
+
+
 # Configuration endpoints
+# Static config payloads never change at runtime, so they are encoded once at import
+_LANGUAGES_JSON = _encode_json({
+    "languages": [
+        {
+            "code": code,
+            "name": name
+        }
+        for code, name in LANGUAGE_NAMES_ITEMS
+    ]
+})
+
+_MODELS_JSON = _encode_json({
+    "models": [
+        {
+            "id": model_id,
+            "description": desc
+        }
+        for model_id, desc in list_supported_models().items()
+    ],
+    "default": settings.openrouter_model
+})
+
+_VOICES_JSON = _encode_json({
+    "voices": [
+        {
+            "id": voice_id,
+            "description": desc
+        }
+        for voice_id, desc in list_available_voices().items()
+    ],
+    "default": settings.openai_tts_voice
+})
+
+
 @app.get("/api/config/languages")
 async def get_supported_languages():
     """Get list of supported languages."""
-    from models import LANGUAGE_NAMES
-
-    return {
-        "languages": [
-            {
-                "code": code.value,
-                "name": name
-            }
-            for code, name in LANGUAGE_NAMES.items()
-        ]
-    }
+    return Response(content=_LANGUAGES_JSON, media_type="application/json")
 
 
 @app.get("/api/config/models")
 async def get_supported_models():
     """Get list of supported translation models."""
-    from services import list_supported_models
-
-    models = list_supported_models()
-
-    return {
-        "models": [
-            {
-                "id": model_id,
-                "description": desc
-            }
-            for model_id, desc in models.items()
-        ],
-        "default": settings.openrouter_model
-    }
+    return Response(content=_MODELS_JSON, media_type="application/json")
 
 
 @app.get("/api/config/voices")
 async def get_available_voices():
     """Get list of available TTS voices."""
-    from services import list_available_voices
-
-    voices = list_available_voices()
-
-    return {
-        "voices": [
-            {
-                "id": voice_id,
-                "description": desc
-            }
-            for voice_id, desc in voices.items()
-        ],
-        "default": settings.openai_tts_voice
-    }
+    return Response(content=_VOICES_JSON, media_type="application/json")
 
 
 # Error handlers
@@ -727,6 +875,7 @@ async def internal_error_handler(request, exc):
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
     uvicorn.run(
@@ -734,5 +883,10 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        # uvloop is not available on Windows (uvicorn[standard] skips it there)
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=1 if settings.debug else settings.uvicorn_workers,
+        backlog=2048
     )
@@ -9,7 +9,8 @@ from .enums import (
     MessageType,
     ProcessingStage,
     LanguageCode,
-    LANGUAGE_NAMES
+    LANGUAGE_NAMES,
+    LANGUAGE_NAMES_ITEMS
 )
 
 from .messages import (
@@ -27,7 +28,10 @@ from .messages import (
     SessionCreateResponse,
     WebRTCOffer,
     WebRTCAnswer,
-    ICECandidate
+    ICECandidate,
+    WebRTCOfferRequest,
+    WebRTCCandidate,
+    WebRTCPatchRequest
 )
 
 from .session import (
@@ -46,6 +50,7 @@ __all__ = [
     "ProcessingStage",
     "LanguageCode",
     "LANGUAGE_NAMES",
+    "LANGUAGE_NAMES_ITEMS",
 
     # Messages
     "BaseMessage",
@@ -63,6 +68,9 @@ __all__ = [
     "WebRTCOffer",
     "WebRTCAnswer",
     "ICECandidate",
+    "WebRTCOfferRequest",
+    "WebRTCCandidate",
+    "WebRTCPatchRequest",
 
     # Session
     "Message",
@@ -26,6 +26,7 @@ class SpeakerTurn(str, Enum):
     """Who is currently speaking."""
     USER = "user"
     PARTNER = "partner"
+    NONE = "none"
 
 
 class MessageType(str, Enum):
@@ -114,3 +115,6 @@ LANGUAGE_NAMES = {
     LanguageCode.HEBREW: "עברית",
     LanguageCode.UKRAINIAN: "Українська",
 }
+
+# (code, display name) string pairs, for listings that need no enum lookups
+LANGUAGE_NAMES_ITEMS = tuple((code.value, name) for code, name in LANGUAGE_NAMES.items())
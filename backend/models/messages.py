@@ -2,8 +2,8 @@
 Message schemas for WebSocket/DataChannel communication.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Any
+from pydantic import AliasChoices, BaseModel, Field, field_validator
+from typing import Optional, Any, Dict, List
 from datetime import datetime
 from .enums import (
     MessageType,
@@ -128,3 +128,39 @@ class ICECandidate(BaseModel):
     candidate: str
     sdp_mid: Optional[str] = None
     sdp_m_line_index: Optional[int] = None
+
+
+# SmallWebRTC signalling bodies (clients send snake_case or camelCase keys)
+
+class WebRTCOfferRequest(BaseModel):
+    """SDP offer posted to /api/webrtc/offer."""
+    sdp: str
+    type: str
+    pc_id: Optional[str] = Field(None, validation_alias=AliasChoices("pc_id", "pcId"))
+    restart_pc: Optional[bool] = Field(
+        None, validation_alias=AliasChoices("restart_pc", "restartPc")
+    )
+    request_data: Optional[Dict[str, Any]] = Field(
+        default_factory=dict, validation_alias=AliasChoices("request_data", "requestData")
+    )
+
+    @field_validator("request_data")
+    @classmethod
+    def _default_request_data(cls, value: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Treat an explicit null like a missing request_data."""
+        return {} if value is None else value
+
+
+class WebRTCCandidate(BaseModel):
+    """Trickled ICE candidate inside a PATCH request."""
+    candidate: str
+    sdp_mid: Optional[str] = Field(None, validation_alias=AliasChoices("sdp_mid", "sdpMid"))
+    sdp_mline_index: Optional[int] = Field(
+        None, validation_alias=AliasChoices("sdp_mline_index", "sdpMLineIndex")
+    )
+
+
+class WebRTCPatchRequest(BaseModel):
+    """ICE candidates patched onto an existing peer connection."""
+    pc_id: str = Field(validation_alias=AliasChoices("pc_id", "pcId"))
+    candidates: List[WebRTCCandidate] = Field(default_factory=list)
@@ -2,11 +2,17 @@
 Session data models and management structures.
 """
 
+import time
+from collections import deque
+from functools import partial
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, Deque
 from datetime import datetime
 from .enums import SessionState, SpeakerTurn, LanguageCode
 
+# Number of messages kept in a session's history
+MAX_SESSION_MESSAGES = 50
+
 
 class Message(BaseModel):
     """Chat message stored in session history."""
@@ -32,13 +38,17 @@ class SessionData(BaseModel):
     # Session metadata
     created_at: datetime = Field(default_factory=datetime.utcnow)
     last_activity: datetime = Field(default_factory=datetime.utcnow)
+    # Monotonic mirror of last_activity used for timeout checks
+    last_activity_ns: int = Field(default_factory=time.monotonic_ns, exclude=True)
 
     # Current state tracking
     current_speaker: Optional[SpeakerTurn] = None
     is_processing: bool = False
 
-    # Message history (limited to last N messages for memory efficiency)
-    messages: List[Message] = Field(default_factory=list, max_length=50)
+    # Message history (ring buffer of the last N messages; oldest evicted on append)
+    messages: Deque[Message] = Field(
+        default_factory=partial(deque, maxlen=MAX_SESSION_MESSAGES)
+    )
 
     # Statistics
     total_user_turns: int = 0
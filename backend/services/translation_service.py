@@ -7,7 +7,8 @@ context-aware translation that preserves tone and nuance.
 
 import asyncio
 import httpx
-from typing import Optional, List
+from collections import OrderedDict
+from typing import Optional, List, Tuple
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 from pipecat.frames.frames import Frame, TextFrame, TranscriptionFrame
 from config import settings
@@ -29,7 +30,8 @@ class TranslationProcessor(FrameProcessor):
         source_language: LanguageCode,
         target_language: LanguageCode,
         model: Optional[str] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         super().__init__()
         self.source_language = source_language
@@ -37,14 +39,20 @@ class TranslationProcessor(FrameProcessor):
         self.model = model or settings.openrouter_model
         self.session_id = session_id
 
-        # HTTP client for API calls
-        self.client = httpx.AsyncClient(
+        # HTTP client for API calls; a shared client keeps its connection pool
+        # across sessions and is closed by its owner, not here
+        self._owns_client = http_client is None
+        self.client = http_client or httpx.AsyncClient(
             timeout=settings.translation_timeout_seconds
         )
 
         # System prompt for translation
         self.system_prompt = self._create_system_prompt()
 
+        # LRU cache of recent translations keyed by (source, target, normalized text)
+        self._cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._cache_size = settings.translation_cache_size
+
         logger.info(
             f"Translation processor created: {source_language.value} → "
             f"{target_language.value}, model={self.model}"
@@ -94,12 +102,24 @@ Output format: Plain text translation only, no markdown or formatting."""
                 await self.push_frame(frame, direction)
                 return
 
-            logger.info(f"[TRANSLATION] Translating: '{original_text}'")
+            cache_key = (
+                self.source_language.value,
+                self.target_language.value,
+                original_text.strip().lower()
+            )
+            translated_text = self._cache.get(cache_key)
+
+            if translated_text is not None:
+                self._cache.move_to_end(cache_key)
+                logger.info(f"[TRANSLATION] ✅ Cache hit: '{translated_text}'")
+            else:
+                logger.info(f"[TRANSLATION] Translating: '{original_text}'")
 
-            # Call translation API
-            translated_text = await self._translate(original_text)
+                # Call translation API
+                translated_text = await self._translate(original_text)
 
-            logger.info(f"[TRANSLATION] ✅ Translation complete: '{translated_text}'")
+                logger.info(f"[TRANSLATION] ✅ Translation complete: '{translated_text}'")
+                self._cache_put(cache_key, translated_text)
 
             # Create new text frame with translation
             translated_frame = TextFrame(text=translated_text)
@@ -113,6 +133,15 @@ Output format: Plain text translation only, no markdown or formatting."""
             # On error, pass through original text
             await self.push_frame(frame, direction)
 
+    def _cache_put(self, key: Tuple[str, str, str], translated_text: str):
+        """Store a translation, evicting the least recently used entry when full."""
+        if self._cache_size <= 0:
+            return
+
+        self._cache[key] = translated_text
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
     async def _translate(self, text: str) -> str:
         """
         Translate text using OpenRouter API.
@@ -184,7 +213,9 @@ Output format: Plain text translation only, no markdown or formatting."""
 
     async def cleanup(self):
         """Cleanup resources."""
-        await self.client.aclose()
+        self._cache.clear()
+        if self._owns_client:
+            await self.client.aclose()
 
 
 class TranslationServiceFactory:
@@ -197,7 +228,8 @@ class TranslationServiceFactory:
         source_language: LanguageCode,
         target_language: LanguageCode,
         model: Optional[str] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ) -> TranslationProcessor:
         """
         Create a translation processor.
@@ -207,6 +239,7 @@ class TranslationServiceFactory:
             target_language: Target language code
             model: LLM model to use (optional)
             session_id: Session ID for logging (optional)
+            http_client: Shared HTTP client to reuse (optional, one is created if omitted)
 
         Returns:
             Translation processor
@@ -215,7 +248,8 @@ class TranslationServiceFactory:
             source_language=source_language,
             target_language=target_language,
             model=model,
-            session_id=session_id
+            session_id=session_id,
+            http_client=http_client
         )
 
 
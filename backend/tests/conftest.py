@@ -0,0 +1,14 @@
+"""
+Shared pytest setup for the backend test suite.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Make the backend modules importable regardless of the invocation directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Settings require API keys; tests never call the real services
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("OPENROUTER_API_KEY", "test-openrouter-key")
@@ -0,0 +1,24 @@
+"""
+Tests for audio level calculation.
+"""
+
+import numpy as np
+
+from utils import calculate_audio_level
+
+
+def test_full_scale_int16_samples_do_not_wrap_around():
+    samples = np.full(320, -32768, dtype=np.int16)
+
+    level = calculate_audio_level(samples, scale=1.0 / 32768.0)
+
+    assert level == 1.0
+
+
+def test_int16_and_float32_samples_give_the_same_level():
+    raw = (np.sin(np.linspace(0, 20 * np.pi, 320)) * 3000).astype(np.int16)
+
+    from_int16 = calculate_audio_level(raw, scale=1.0 / 32768.0)
+    from_float32 = calculate_audio_level(raw.astype(np.float32) / 32768.0)
+
+    assert np.isclose(from_int16, from_float32, rtol=1e-5)
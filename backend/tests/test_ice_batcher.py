@@ -0,0 +1,98 @@
+"""
+Tests for ICE candidate coalescing.
+"""
+
+import asyncio
+
+import pytest
+
+from utils import IceCandidateBatcher
+
+
+class RecordingFlush:
+    """Flush callback that records every batch it applies."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, pc_id, candidates):
+        self.calls.append((pc_id, list(candidates)))
+
+
+async def test_candidates_within_window_are_applied_together():
+    flush = RecordingFlush()
+    batcher = IceCandidateBatcher(flush, delay_seconds=0.02, max_candidates=16)
+
+    futures = [batcher.add("pc-1", [f"cand-{i}"]) for i in range(3)]
+    await asyncio.gather(*futures)
+
+    assert flush.calls == [("pc-1", ["cand-0", "cand-1", "cand-2"])]
+
+
+async def test_peer_connections_are_batched_separately():
+    flush = RecordingFlush()
+    batcher = IceCandidateBatcher(flush, delay_seconds=0.02, max_candidates=16)
+
+    await asyncio.gather(
+        batcher.add("pc-1", ["a"]),
+        batcher.add("pc-2", ["b"]),
+        batcher.add("pc-1", ["c"]),
+    )
+
+    assert sorted(flush.calls) == [("pc-1", ["a", "c"]), ("pc-2", ["b"])]
+
+
+async def test_full_batch_flushes_before_window_closes():
+    flush = RecordingFlush()
+    batcher = IceCandidateBatcher(flush, delay_seconds=10.0, max_candidates=4)
+
+    futures = [batcher.add("pc-1", [i]) for i in range(4)]
+    await asyncio.wait_for(asyncio.gather(*futures), timeout=1.0)
+
+    assert flush.calls == [("pc-1", [0, 1, 2, 3])]
+
+    # The next candidate opens a fresh batch
+    later = batcher.add("pc-1", [4])
+    await batcher.close()
+    await later
+    assert flush.calls[-1] == ("pc-1", [4])
+
+
+async def test_close_applies_pending_batches_and_rejects_new_ones():
+    flush = RecordingFlush()
+    batcher = IceCandidateBatcher(flush, delay_seconds=10.0, max_candidates=16)
+
+    pending = batcher.add("pc-1", ["a"])
+    await asyncio.wait_for(batcher.close(), timeout=1.0)
+
+    assert pending.done()
+    assert flush.calls == [("pc-1", ["a"])]
+
+    with pytest.raises(RuntimeError):
+        batcher.add("pc-1", ["b"])
+
+
+async def test_flush_error_reaches_every_request_in_the_batch():
+    calls = []
+
+    async def failing_flush(pc_id, candidates):
+        calls.append((pc_id, list(candidates)))
+        raise ValueError(f"unknown peer connection {pc_id}")
+
+    batcher = IceCandidateBatcher(failing_flush, delay_seconds=0.01, max_candidates=16)
+
+    results = await asyncio.gather(
+        batcher.add("missing", ["a"]),
+        batcher.add("missing", ["b"]),
+        return_exceptions=True
+    )
+
+    assert calls == [("missing", ["a", "b"])]
+    assert all(isinstance(r, ValueError) for r in results)
+
+    # A failed batch is not retained; the next candidate starts over
+    flushed = batcher.add("missing", ["c"])
+    with pytest.raises(ValueError):
+        await flushed
+    assert calls[-1] == ("missing", ["c"])
+    await batcher.close()
@@ -0,0 +1,40 @@
+"""
+Tests for the WebRTC signalling request models.
+"""
+
+from models import WebRTCOfferRequest, WebRTCPatchRequest
+
+
+def test_offer_accepts_null_request_data():
+    offer = WebRTCOfferRequest.model_validate(
+        {"sdp": "v=0", "type": "offer", "request_data": None}
+    )
+
+    assert offer.request_data == {}
+
+
+def test_offer_accepts_camel_case_keys():
+    offer = WebRTCOfferRequest.model_validate({
+        "sdp": "v=0",
+        "type": "offer",
+        "pcId": "pc-1",
+        "restartPc": True,
+        "requestData": {"session_id": "abc"},
+    })
+
+    assert offer.pc_id == "pc-1"
+    assert offer.restart_pc is True
+    assert offer.request_data == {"session_id": "abc"}
+
+
+def test_patch_accepts_snake_and_camel_case_candidates():
+    patch = WebRTCPatchRequest.model_validate({
+        "pcId": "pc-1",
+        "candidates": [
+            {"candidate": "candidate:1", "sdpMid": "0", "sdpMLineIndex": 0},
+            {"candidate": "candidate:2", "sdp_mid": "1", "sdp_mline_index": 1},
+        ],
+    })
+
+    assert patch.pc_id == "pc-1"
+    assert [(c.sdp_mid, c.sdp_mline_index) for c in patch.candidates] == [("0", 0), ("1", 1)]
@@ -0,0 +1,54 @@
+"""
+Tests for session bookkeeping in the session manager.
+"""
+
+import pytest
+
+from core.session_manager import SessionManager
+from models import LanguageCode, SessionState
+
+
+@pytest.fixture
+def manager():
+    return SessionManager()
+
+
+def test_stage_latency_is_seeded_by_its_own_first_sample(manager):
+    session = manager.create_session(LanguageCode.ENGLISH, LanguageCode.SPANISH)
+
+    # Partner turn: no TTS
+    manager.update_metrics(session.session_id, stt_latency=300.0, translation_latency=500.0)
+    # User turn: first TTS sample
+    manager.update_metrics(
+        session.session_id, stt_latency=300.0, translation_latency=500.0, tts_latency=400.0
+    )
+
+    metrics = manager.get_metrics(session.session_id)
+    assert metrics.avg_tts_latency == 400.0
+    assert metrics.avg_stt_latency == 300.0
+    assert metrics.avg_translation_latency == 500.0
+
+
+async def test_close_session_records_disconnect(manager):
+    session = manager.create_session(LanguageCode.ENGLISH, LanguageCode.SPANISH)
+    manager.get_state_machine(session.session_id).handle_ptt_press()
+    assert manager.list_sessions()[0].state is SessionState.USER_SPEAKING
+
+    await manager.close_session(session.session_id)
+
+    assert session.state is SessionState.DISCONNECTED
+    assert manager.list_sessions() == []
+
+
+async def test_expiry_heap_does_not_grow_with_activity_or_churn(manager):
+    session = manager.create_session(LanguageCode.ENGLISH, LanguageCode.SPANISH)
+    state_machine = manager.get_state_machine(session.session_id)
+    for _ in range(50):
+        state_machine.handle_ptt_press()
+        state_machine.handle_ptt_release()
+
+    for _ in range(20):
+        churned = manager.create_session(LanguageCode.ENGLISH, LanguageCode.SPANISH)
+        await manager.close_session(churned.session_id)
+
+    assert len(manager._expiry_heap) <= 2 * manager.active_count() + 1
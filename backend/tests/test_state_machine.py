@@ -0,0 +1,20 @@
+"""
+Tests for PTT handling in the translator state machine.
+"""
+
+from core.state_machine import TranslatorStateMachine
+from models import SessionState, SpeakerTurn
+
+
+def test_ptt_press_and_release_apply_immediately():
+    sm = TranslatorStateMachine("test-session")
+    sm.connect()
+
+    sm.handle_ptt_press()
+    assert sm.state is SessionState.USER_SPEAKING
+    assert sm.ptt_pressed
+    assert sm.current_speaker is SpeakerTurn.USER
+
+    sm.handle_ptt_release()
+    assert sm.state is SessionState.PARTNER_LISTENING
+    assert not sm.ptt_pressed
@@ -2,7 +2,8 @@
 Utility modules for Nebula Translate backend.
 """
 
-from .logger import setup_logging, get_logger, SessionLogger
+from .logger import setup_logging, get_logger, is_enabled_for, SessionLogger
+from .ice_batcher import IceCandidateBatcher
 from .audio_utils import (
     pcm_to_float32,
     float32_to_pcm,
@@ -17,8 +18,12 @@ __all__ = [
     # Logging
     "setup_logging",
     "get_logger",
+    "is_enabled_for",
     "SessionLogger",
 
+    # WebRTC signalling
+    "IceCandidateBatcher",
+
     # Audio utilities
     "pcm_to_float32",
     "float32_to_pcm",
@@ -51,12 +51,14 @@ def float32_to_pcm(audio_float32: np.ndarray) -> bytes:
     return audio_int16.tobytes()
 
 
-def calculate_audio_level(audio_data: np.ndarray) -> float:
+def calculate_audio_level(audio_data: np.ndarray, scale: float = 1.0) -> float:
     """
     Calculate RMS audio level for visualization.
 
     Args:
-        audio_data: Float32 audio samples
+        audio_data: Audio samples (float, or integer such as raw PCM16)
+        scale: Factor applied to the RMS to normalize unscaled samples
+               (e.g. 1/32768 for raw PCM16 values)
 
     Returns:
         RMS level normalized to [0.0, 1.0]
@@ -64,8 +66,13 @@ def calculate_audio_level(audio_data: np.ndarray) -> float:
     if len(audio_data) == 0:
         return 0.0
 
+    # Integer samples would wrap around when squared, so widen them first
+    if not np.issubdtype(audio_data.dtype, np.floating):
+        audio_data = audio_data.astype(np.float64)
+
     # Calculate RMS (Root Mean Square)
-    rms = np.sqrt(np.mean(audio_data ** 2))
+    # vdot reads the buffer once without materializing a squared temporary
+    rms = np.sqrt(np.vdot(audio_data, audio_data) / audio_data.size) * scale
 
     # Normalize to [0, 1] range
     # Typical speech RMS is around 0.1-0.3, so we scale accordingly
@@ -0,0 +1,126 @@
+"""
+Coalescing of trickled ICE candidates into batched patch requests.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Set
+
+# Applies one batch of candidates to a peer connection: (pc_id, candidates)
+IceFlushCallback = Callable[[str, List[Any]], Awaitable[None]]
+
+
+class _IceBatch:
+    """Candidates pending for one peer connection and the outcome of applying them."""
+
+    __slots__ = ("candidates", "result")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.candidates: List[Any] = []
+        self.result: asyncio.Future = loop.create_future()
+
+
+class IceCandidateBatcher:
+    """
+    Coalesces ICE candidates per peer connection into single flush calls.
+
+    Browsers trickle candidates as a burst of single-candidate PATCH requests.
+    The first candidate for a peer connection opens a short window; everything
+    that arrives within it (up to a size cap) is applied in one flush. A batch
+    is forgotten as soon as it is flushed, so no per-connection state outlives
+    the window.
+    """
+
+    def __init__(
+        self,
+        flush: IceFlushCallback,
+        delay_seconds: float = 0.02,
+        max_candidates: int = 16
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            flush: Coroutine function applying a batch to a peer connection
+            delay_seconds: Coalescing window opened by a batch's first candidate
+            max_candidates: Batch size that triggers a flush before the window closes
+        """
+        self._flush = flush
+        self._delay_seconds = delay_seconds
+        self._max_candidates = max_candidates
+        self._batches: Dict[str, _IceBatch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+
+    def add(self, pc_id: str, candidates: List[Any]) -> asyncio.Future:
+        """
+        Queue candidates for a peer connection.
+
+        Args:
+            pc_id: Peer connection identifier
+            candidates: Candidates to apply
+
+        Returns:
+            Future resolved once the batch holding these candidates is applied,
+            or failed with the error raised by the flush
+
+        Raises:
+            RuntimeError: If the batcher has been closed
+        """
+        if self._closed:
+            raise RuntimeError("ICE candidate batcher is closed")
+
+        batch = self._batches.get(pc_id)
+        if batch is None:
+            batch = self._batches[pc_id] = _IceBatch(asyncio.get_running_loop())
+            self._spawn(self._flush_later(pc_id, batch))
+        batch.candidates.extend(candidates)
+
+        if len(batch.candidates) >= self._max_candidates:
+            self._spawn(self._flush_batch(pc_id, batch))
+
+        return batch.result
+
+    async def close(self):
+        """Stop accepting candidates, apply pending batches and wait for every flush."""
+        self._closed = True
+
+        for pc_id, batch in list(self._batches.items()):
+            self._spawn(self._flush_batch(pc_id, batch))
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]):
+        """Run a flush in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_later(self, pc_id: str, batch: _IceBatch):
+        """Flush a batch once its coalescing window closes, unless it was flushed earlier."""
+        await asyncio.wait({batch.result}, timeout=self._delay_seconds)
+        await self._flush_batch(pc_id, batch)
+
+    async def _flush_batch(self, pc_id: str, batch: _IceBatch):
+        """Apply a batch and resolve its future; only the first caller flushes it."""
+        if self._batches.get(pc_id) is not batch:
+            return
+        # Detach before awaiting so later candidates open a new batch
+        del self._batches[pc_id]
+
+        try:
+            await self._flush(pc_id, batch.candidates)
+        except Exception as e:
+            error = e
+        except BaseException:
+            error = RuntimeError("ICE candidate flush was interrupted")
+            raise
+        else:
+            error = None
+        finally:
+            # Every request that contributed to the batch gets its outcome
+            if not batch.result.done():
+                if error is None:
+                    batch.result.set_result(None)
+                else:
+                    batch.result.set_exception(error)
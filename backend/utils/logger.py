@@ -8,6 +8,9 @@ from loguru import logger
 from pythonjsonlogger import jsonlogger
 from config import settings
 
+# Lowest level accepted by any configured sink (everything passes until setup_logging runs)
+_min_level_no = 0
+
 
 class InterceptHandler(logging.Handler):
     """
@@ -34,6 +37,7 @@ class InterceptHandler(logging.Handler):
 
 def setup_logging():
     """Configure structured logging for the application."""
+    global _min_level_no
 
     # Remove default loguru handler
     logger.remove()
@@ -57,6 +61,9 @@ def setup_logging():
             "<level>{message}</level>"
         )
 
+    # Sinks are enqueued: logging calls only append a record and a background
+    # thread does the formatting and I/O, so the event loop never blocks on writes.
+
     # Add handler to stderr
     logger.add(
         sys.stderr,
@@ -65,6 +72,7 @@ def setup_logging():
         colorize=True,
         backtrace=True,
         diagnose=settings.debug,
+        enqueue=True,
     )
 
     # Add file handler for production
@@ -77,8 +85,14 @@ def setup_logging():
             retention="7 days",
             compression="zip",
             serialize=True,  # JSON output
+            enqueue=True,
         )
 
+    # Track the lowest enabled level so hot paths can skip building messages
+    _min_level_no = logger.level(settings.log_level.upper()).no
+    if settings.environment == "production":
+        _min_level_no = min(_min_level_no, logger.level("INFO").no)
+
     # Intercept standard logging
     logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
 
@@ -96,6 +110,19 @@ def get_logger(name: str):
     return logger.bind(module=name)
 
 
+def is_enabled_for(level: int) -> bool:
+    """
+    Check whether a message at the given level would be emitted by any sink.
+
+    Args:
+        level: Numeric level (loguru levels share the stdlib ``logging`` values)
+
+    Returns:
+        True if at least one sink accepts the level
+    """
+    return level >= _min_level_no
+
+
 # Session-aware logging context
 class SessionLogger:
     """Logger with session context."""
@@ -104,17 +131,23 @@ class SessionLogger:
         self.session_id = session_id
         self.logger = logger.bind(session_id=session_id)
 
-    def debug(self, message: str, **kwargs):
-        self.logger.debug(message, **kwargs)
+    def is_enabled_for(self, level: int) -> bool:
+        return is_enabled_for(level)
+
+    def debug(self, message: str, *args, **kwargs):
+        self.logger.debug(message, *args, **kwargs)
+
+    def info(self, message: str, *args, **kwargs):
+        self.logger.info(message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs):
-        self.logger.info(message, **kwargs)
+    def warning(self, message: str, *args, **kwargs):
+        self.logger.warning(message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs):
-        self.logger.warning(message, **kwargs)
+    def error(self, message: str, *args, **kwargs):
+        self.logger.error(message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs):
-        self.logger.error(message, **kwargs)
+    def exception(self, message: str, *args, **kwargs):
+        self.logger.exception(message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs):
-        self.logger.critical(message, **kwargs)
+    def critical(self, message: str, *args, **kwargs):
+        self.logger.critical(message, *args, **kwargs)